@@ -1,5 +1,13 @@
 """Operations on data"""
 import math as _math
+import zipfile as _zipfile
+import posixpath as _posixpath
+import xml.etree.ElementTree as _ElementTree
+import atexit as _atexit
+import collections as _collections
+import operator as _operator
+import functools as _functools
+import random as _random
 import string as _string
 from abc import ABCMeta as _ABCMeta
 from warnings import warn as _warn
@@ -26,8 +34,6 @@ with _fuckit:
         from arcpy.conversion import ExportTable, ExportFeatures  # noqa
     import xlwings as _xlwings  # never will be implemented on linux
 
-import great_expectations as _gx
-
 import funclite.iolib as _iolib
 import funclite.baselib as _baselib
 import funclite.stringslib as _stringslib
@@ -266,7 +272,98 @@ class Funcs(_MixinNameSpace, metaclass=_ABCMeta):
 class Excel(_MixinNameSpace):  # noqa
     """
     Work with excel workbooks.
+
+    xlsx/xlsm workbooks are read directly from their xml parts, without starting excel.
+    For other workbooks, a single hidden Excel instance is started on first use and reused by all calls. It is closed when python exits.
     """
+    _app = None
+
+    @classmethod
+    def _get_app(cls):
+        """Get the shared hidden excel instance, starting it if needed"""
+        if cls._app is None:
+            cls._app = _xlwings.App(visible=False, add_book=False)
+            _atexit.register(cls._quit_app)
+        return cls._app
+
+    @classmethod
+    def _quit_app(cls):
+        if cls._app is not None:
+            with _fuckit:
+                cls._app.quit()
+            cls._app = None
+
+    @staticmethod
+    def _xlsx_info(workbook: str) -> tuple[list[str], list[str]]:
+        """Read the worksheet and listobject names from the xml parts of an xlsx/xlsm package.
+
+        Follows the workbook -> worksheet -> table relationships, so names come back in the same order as book.sheets and sheet.tables in xlwings.
+        Chart sheets are excluded, as they are from book.sheets.
+        """
+        def _local(tag):
+            return tag.rsplit('}', 1)[-1]
+
+        def _rid(el):  # the r:id attribute, whatever the relationships namespace prefix
+            return next((v for k, v in el.attrib.items() if _local(k) == 'id'), None)
+
+        def _rels(Z, part):  # {Id: (Type, part path of the target)} for the relationships of part
+            rels_part = _posixpath.join(_posixpath.dirname(part), '_rels', _posixpath.basename(part) + '.rels')
+            if rels_part not in Z.namelist(): return {}
+            with Z.open(rels_part) as f:
+                out = {}
+                for el in _ElementTree.parse(f).iter():
+                    if _local(el.tag) != 'Relationship': continue
+                    tgt = el.get('Target')
+                    tgt = tgt.lstrip('/') if tgt.startswith('/') else _posixpath.normpath(_posixpath.join(_posixpath.dirname(part), tgt))
+                    out[el.get('Id')] = (el.get('Type').rsplit('/', 1)[-1], tgt)
+                return out
+
+        with _zipfile.ZipFile(workbook) as Z:
+            wb_rels = _rels(Z, 'xl/workbook.xml')
+            with Z.open('xl/workbook.xml') as f:
+                sheet_els = [el for el in _ElementTree.parse(f).iter() if _local(el.tag) == 'sheet']
+
+            sheets, los = [], []
+            for el in sheet_els:
+                typ, sheet_part = wb_rels.get(_rid(el), (None, None))
+                if typ != 'worksheet': continue  # chartsheet, dialogsheet etc.
+                sheets.append(el.get('name'))
+
+                sh_rels = _rels(Z, sheet_part)
+                with Z.open(sheet_part) as f:
+                    table_rids = [_rid(tp) for tp in _ElementTree.parse(f).iter() if _local(tp.tag) == 'tablePart']
+                for rid in table_rids:
+                    with Z.open(sh_rels[rid][1]) as f:
+                        root = _ElementTree.parse(f).getroot()
+                        los.append(root.get('displayName') or root.get('name'))
+        return sheets, los
+
+    @staticmethod
+    def excel_workbook_info(workbook: str) -> tuple[list[str], list[str]]:
+        """
+        Get the worksheets and listobjects in workbook, opening it once.
+
+        Args:
+            workbook (str): The workbook (xlsx)
+
+        Returns:
+            tuple[list[str], list[str]]: list of worksheets, list of listobjects
+
+        Examples:
+            >>> Excel.excel_workbook_info('C:/temp/my.xlsx')
+            (['Sheet1', 'Sheet2'], ['Table1', 'Table2'])
+        """
+        workbook = _path.normpath(workbook)
+        if _zipfile.is_zipfile(workbook):  # xlsx, xlsm. Read the package xml directly, no need for excel
+            return Excel._xlsx_info(workbook)
+
+        book = Excel._get_app().books.open(workbook)
+        try:
+            sheets = [sht.name for sht in book.sheets]
+            los = [lo.name for lo in _baselib.list_flatten([sheet.tables for sheet in book.sheets])]
+        finally:
+            book.close()  # we dont want to hold a lock on the workbook
+        return sheets, los
 
     @staticmethod
     def excel_worksheets_get(workbook: str) -> list[str]:
@@ -283,12 +380,7 @@ class Excel(_MixinNameSpace):  # noqa
             >>> Excel.excel_worksheets_get('C:/temp/my.xlsx')
             ['Sheet1', 'Sheet2']
         """
-        workbook = _path.normpath(workbook)
-        fld, fname = _iolib.get_file_parts2(workbook)[0:2]
-        with _xlwings.App(visible=False) as App:
-            _ = App.books.open(workbook)
-            out = [sht.name for sht in App.books[fname].sheets]
-        return out
+        return Excel.excel_workbook_info(workbook)[0]
 
     @staticmethod
     def excel_listobjects_get(workbook: str) -> list[str]:
@@ -305,12 +397,7 @@ class Excel(_MixinNameSpace):  # noqa
             >>> Excel.excel_listobjects_get('C:/temp/my.xlsx')
             ['Table1', 'Table2']
         """
-        workbook = _path.normpath(workbook)
-        fld, fname = _iolib.get_file_parts2(workbook)[0:2]
-        with _xlwings.App(visible=False) as App:
-            _ = App.books.open(workbook)
-            out = [lo.name for lo in _baselib.list_flatten([sheet.tables for sheet in App.books[fname].sheets])]
-        return out
+        return Excel.excel_workbook_info(workbook)[1]
 
 
 class ResultAsPandas(_mixins.MixinPandasHelper):
@@ -336,10 +423,11 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
 
     Members:
         df (_pd.DataFrame): Dataframe of the output layer
-        df_lower (_pd.DataFrame): Dataframe of the output layer, all col names forced to lower case
+        df_lower (_pd.DataFrame): Dataframe of the output layer, all col names forced to lower case. Built on first access and shares its data with df, so treat both as read only
         _fname_output (str): Name of the in-memory layer/table output created by execution of "tool"
         execution_result (_arcpy.Result): The result object returned from execution of "tool"
         Results: A dictionary of all Results, the main result is keyed as "main", with any additional results keyed with the values in the additional_layer_args member.
+            Additional results are only read into pandas the first time their df or df_lower is accessed.
 
 
     Raises:
@@ -391,15 +479,19 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
     """
 
     class _LayerDataFrame(_mixins.MixinPandasHelper):
-        def __init__(self, arg_name: str, fname_output: str, df: _pd.DataFrame = None):  # noqa
+        def __init__(self, arg_name: str, fname_output: str, df: _pd.DataFrame = None, lazy: bool = False):  # noqa
             self.arg_name = arg_name
             self.fname_output = fname_output
             self._df = None
-            self.df_lower = None
+            self._df_lower = None
+            self._lazy = lazy  # read fname_output on first access to df/df_lower
             self.df = df
 
         @property
         def df(self):
+            if self._df is None and self._lazy:
+                self._lazy = False
+                self.df = table_as_pandas2(self.fname_output, exclude_cols=('Shape',))
             return self._df
 
         @df.setter
@@ -407,9 +499,26 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
             if self._df is None:
                 self._df = df
 
-            if self.df_lower is None:
-                self.df_lower = df.copy()
-                self.df_lower.columns = self.df_lower.columns.str.lower()
+        @property
+        def df_lower(self):
+            if self._df_lower is None and self.df is not None:
+                self._df_lower = self._df.rename(columns=str.lower, copy=False)  # shares data with df, only the column labels differ
+            return self._df_lower
+
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, df: _pd.DataFrame):
+        self._df = df
+        self._df_lower = None
+
+    @property
+    def df_lower(self):
+        if self._df_lower is None and self._df is not None:
+            self._df_lower = self._df.rename(columns=str.lower, copy=False)  # shares data with df, only the column labels differ
+        return self._df_lower
 
     def __init__(self,  # noqa
                  tool,
@@ -423,6 +532,8 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
                  memory_workspace: str = 'in_memory',
                  **kwargs):
 
+        self._df = None
+        self._df_lower = None
         self._kwargs = kwargs
         self._tool = tool
         self._in_features = in_features
@@ -434,7 +545,7 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
             if isinstance(additional_layer_args, str): additional_layer_args = (additional_layer_args,)
             for s in additional_layer_args:
                 lyr_tmp = r'%s\%s' % ('in_memory', _stringslib.rndstr(from_=_string.ascii_lowercase))
-                self.Results[s] = ResultAsPandas._LayerDataFrame(s, lyr_tmp)
+                self.Results[s] = ResultAsPandas._LayerDataFrame(s, lyr_tmp, lazy=True)
                 kwargs[s] = lyr_tmp
 
         errstr = 'The tool "%s" had unknown keywords. ' % str(tool)
@@ -468,16 +579,50 @@ class ResultAsPandas(_mixins.MixinPandasHelper):
             raise _errors.DataUnknownKeywordsForTool(errstr)
 
         self.df = table_as_pandas2(self.result_memory_layer, cols=columns, where=where, exclude_cols=exclude_cols, as_int=as_int, as_float=as_float)
-        self.df_lower = self.df.copy()
-        self.df_lower.columns = self.df_lower.columns.str.lower()
 
-        # check, LDF should behave as byref
-        for LDF in self.Results.values():
-            LDF.df = table_as_pandas2(LDF.fname_output, exclude_cols=('Shape',))
+        # Additional results are read into pandas on first access to their df/df_lower, so unused outputs cost nothing
 
         self.Results['main'] = ResultAsPandas._LayerDataFrame('main', self.result_memory_layer, self.df)
 
 
+def _tuple_list_dtype(cols: list[tuple]) -> (_np.dtype, None):
+    """Get a numpy structured dtype for decoded tuple_list_to_table cols, or None if any type has no numpy equivalent"""
+    np_types = {'SHORT': '<i2', 'SMALLINTEGER': '<i2', 'LONG': '<i4', 'INTEGER': '<i4', 'FLOAT': '<f4', 'DOUBLE': '<f8'}
+    out = []
+    for f in cols:
+        ftype = f[1].upper()
+        if ftype in ('TEXT', 'STRING'):
+            flength = int(f[2]) if len(f) > 2 and str(f[2]).isdigit() else 255  # 255 is the AddField default
+            out.append((f[0], '<U%s' % flength))
+        elif ftype in np_types:
+            out.append((f[0], np_types[ftype]))
+        else:
+            return None
+    return _np.dtype(out)
+
+
+def _tuple_list_numpy_safe(x: list, dt: _np.dtype) -> bool:
+    """
+    Check the rows in x fit dt exactly, so NumPyArrayToTable writes what the insert cursor would.
+    numpy silently truncates long text and casts floats and numeric strings into integer columns, where the insert cursor raises.
+    """
+    for j, nm in enumerate(dt.names):
+        if not _numpy_values_safe((rw[j] for rw in x), dt.fields[nm][0]): return False
+    return True
+
+
+def _numpy_values_safe(vals, sub: _np.dtype) -> bool:
+    """Check every value in vals can be assigned to an array of dtype sub without numpy truncating or casting it, see _tuple_list_numpy_safe"""
+    if sub.kind == 'U':
+        max_len = sub.itemsize // 4
+        return all(isinstance(v, str) and len(v) <= max_len for v in vals)
+    if sub.kind == 'i':
+        info = _np.iinfo(sub)
+        return all(isinstance(v, int) and not isinstance(v, bool) and info.min <= v <= info.max for v in vals)
+    # floats, ints are fine here too
+    return all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in vals)
+
+
 def tuple_list_to_table(x, out_tbl, cols, null_number=None, null_text=None):
     """Save a list of tuples as table out_tbl and return catalog path to it.
 
@@ -494,8 +639,8 @@ def tuple_list_to_table(x, out_tbl, cols, null_number=None, null_text=None):
             e.g.: ('ATextColumn', 'TEXT', 250).
             To leave out length, simply leave it out or set to '#'
 
-        nullNumber (int, None): A value to replace null (None) values in numeric columns, default is None and does no replacement
-        nullText (str, None): A value to replace null (None) values in text columns, default is None and does no replacement
+        null_number (int, None): A value to replace null (None) values in numeric columns, default is None and does no replacement
+        null_text (str, None): A value to replace null (None) values in text columns, default is None and does no replacement
 
     Examples:
         >>> x_ = [(...),(...),(...),(...),(...), ...]
@@ -520,6 +665,29 @@ def tuple_list_to_table(x, out_tbl, cols, null_number=None, null_text=None):
 
     dname = _path.dirname(out_tbl)
     if dname in ('', u''): dname = _arcpy.env.workspace
+
+    x = list(x)
+    if do_replace and x:
+        # replace nulls a column at a time with masks over an object array
+        arr = _np.array(x, dtype=object)
+        if do_replace_number:
+            for j in replace_numbers:
+                col = arr[:, j]
+                col[_np.equal(col, None)] = null_number
+        if do_replace_text:
+            for j in replaces_text:
+                col = arr[:, j]
+                col[_np.equal(col, None)] = null_text
+        x = arr.tolist()
+
+    # Bulk write through a numpy structured array where we can. numpy cannot hold nulls in typed columns and would silently
+    # truncate or cast values which do not fit the declared field, so any such data falls through to the insert cursor.
+    dt = _tuple_list_dtype(cols)
+    if dt is not None and _tuple_list_numpy_safe(x, dt):
+        out_tbl = _path.join(dname, _path.basename(out_tbl))
+        _arcpy.da.NumPyArrayToTable(_np.array([tuple(rw) for rw in x], dtype=dt), out_tbl)
+        return out_tbl
+
     r = _arcpy.CreateTable_management(dname, _path.basename(out_tbl))
     out_tbl = r.getOutput(0)
 
@@ -536,16 +704,6 @@ def tuple_list_to_table(x, out_tbl, cols, null_number=None, null_text=None):
 
     with _arcpy.da.InsertCursor(out_tbl, fields) as ic:
         for rw in x:
-            if do_replace:
-                rw = list(rw)
-                # TODO This looks bugged, need to debug
-                if i in replace_numbers:  # noqa
-                    if rw[i] is None:
-                        rw[i] = null_number
-                if i in replaces_text:
-                    if rw[i] is None:
-                        rw[i] = null_text
-                rw = tuple(rw)
             ic.insertRow(rw)
     return out_tbl
 
@@ -611,18 +769,27 @@ def field_values(fname: str, col: (str, list), where: (str, None) = None, order_
         order_by = 'ORDER BY ' + str(order_by)
 
     # This check was added as we get a wierd error if field doesnt exists in enterprise geodatabase - make warning more explicit
-    bad_fields = _baselib.list_not(list(map(str.lower, cols)), list(map(str.lower, _struct.field_list(fname))))
+    flds_lower = set(map(str.lower, _struct.field_list(fname)))
+    bad_fields = [c for c in map(str.lower, cols) if c not in flds_lower]
     if bad_fields:
         raise _errors.FieldNotFound('Field(s) "%s" not found in "%s"' % (bad_fields, fname))
 
     # retrieve values with search cursor
-    ret = []
-    with _arcpy.da.SearchCursor(fname, cols, where_clause=where, sql_clause=(None, order_by)) as sc:
-        for row in sc:
+    # For distinct, push DISTINCT down to the database so duplicate rows never cross the cursor. Not valid with tokens (e.g. OID@).
+    # Shapefiles and some other sources ignore or reject the prefix, we fall back and still dedup in python below to guarantee distinct.
+    prefix = 'DISTINCT' if distinct and not any('@' in c for c in cols) else None
+
+    def _read(pre):
+        with _arcpy.da.SearchCursor(fname, cols, where_clause=where, sql_clause=(pre, order_by)) as sc:
             if multicols:
-                ret.append(row)
-            else:
-                ret.append(row[0])
+                return [row for row in sc]
+            return [row[0] for row in sc]
+
+    try:
+        ret = _read(prefix)
+    except RuntimeError:
+        if not prefix: raise
+        ret = _read(None)
 
     if distinct:
         ret = list(set(ret))
@@ -687,9 +854,14 @@ def field_has_duplicates(fname: str, col: str, f: any = lambda v: v) -> bool:
         >>> field_get_dup_values('c:/my.gdb/everyones_fave_colour', 'colour', f=str.lower)
         True
     """
-    s = field_get_dup_values(fname, col, value_list_only=True, f=f)
-    if s:
-        return True
+    # Stop at the first repeat rather than counting every value as field_get_dup_values does
+    seen = set()
+    with _arcpy.da.SearchCursor(_path.normpath(fname), [col]) as Cur:
+        for row in Cur:
+            v = f(row[0])
+            if v in seen:
+                return True
+            seen.add(v)
     return False
 
 
@@ -722,9 +894,12 @@ def field_get_dup_values(fname: str, col: str, value_list_only: bool = False, f:
         {'blue':2,'black':5}
     """
     fname = _path.normpath(fname)
-    vals = list(map(f, field_values(fname, col)))
-    res = _baselib.list_get_dups(vals, value_list_only=value_list_only)
-    return res
+    # Counter does its counting loop in C and keeps the values as is. pandas value_counts would cast ints to floats where there are nulls.
+    cnt = _collections.Counter(map(f, field_values(fname, col)))
+    dups = {k: v for k, v in cnt.items() if v > 1}
+    if value_list_only:
+        return list(dups.keys())
+    return dups
 
 
 def fields_get_dup_values(fname: str, cols: list, value_list_only: bool = False, sep: str = _stringslib.Characters.Language.emdash, f: any = lambda v: v):
@@ -796,6 +971,7 @@ def key_info(parent: str, parent_field: str, child: str, child_field: str, as_oi
 
     Notes:
         The OIDs can be used for futher processing ...
+        With as_oids, parent_only and both are oids in parent, child_only are oids in child.
 
     Examples:
 
@@ -812,20 +988,24 @@ def key_info(parent: str, parent_field: str, child: str, child_field: str, as_oi
         This is also exposed in arcapipro.info
     """
 
-    parent_values = field_values(parent, parent_field, distinct=True)
-    child_values = field_values(child, child_field, distinct=True)
-
     if not as_oids:
+        parent_values = field_values(parent, parent_field, distinct=True)
+        child_values = field_values(child, child_field, distinct=True)
         d = _baselib.list_sym_diff(parent_values, child_values, rename_keys=('parent_only', 'both', 'child_only'))
         return d
 
-    where = _sql.query_where_in(parent_field, parent_values)
-    parent_oids = field_values(parent, 'OID@', where=where)
+    # One pass per table, reading the oid alongside the key, then classify each row's oid by whether its key is in the other table.
+    # Previously the oids of both tables were diffed against each other, which compared unrelated oid numbers.
+    with _arcpy.da.SearchCursor(parent, ['OID@', parent_field]) as Cur:
+        parent_rows = [tuple(r) for r in Cur]
+    with _arcpy.da.SearchCursor(child, ['OID@', child_field]) as Cur:
+        child_rows = [tuple(r) for r in Cur]
 
-    where = _sql.query_where_in(child_field, child_values)
-    child_oids = field_values(child, 'OID@', where=where)
-
-    return _baselib.list_sym_diff(parent_oids, child_oids, rename_keys=('parent_only', 'both', 'child_only'))
+    parent_keys = {k for _, k in parent_rows}
+    child_keys = {k for _, k in child_rows}
+    return {'parent_only': [oid for oid, k in parent_rows if k not in child_keys],
+            'both': [oid for oid, k in parent_rows if k in child_keys],
+            'child_only': [oid for oid, k in child_rows if k not in parent_keys]}
 
 
 def table_as_pandas(fname, cols=(), where='', null_value=_np.NaN, **kwargs):
@@ -892,7 +1072,6 @@ def pandas_to_table(df: _pd.DataFrame, fname: str, overwrite=False, max_str_len=
     # https://pro.arcgis.com/en/pro-app/2.8/arcpy/data-access/numpyarraytotable.htm
     # https://numpy.org/doc/stable/user/basics.rec.html
     fname = _path.normpath(fname)
-    df_copy = df.copy(deep=True)
     if overwrite:
         _struct.fc_delete2(fname)
 
@@ -901,12 +1080,13 @@ def pandas_to_table(df: _pd.DataFrame, fname: str, overwrite=False, max_str_len=
     else:
         s = 'bytes'
 
-    for i, t in enumerate(df_copy.dtypes):
-        if str(t) == 'object':  # object, assume string .. ok for now, extend on a case by case basis as expect other stuff will error like dates
-            if fix_ascii_errors:
-                df_copy[df_copy.columns[i]] = df_copy[df_copy.columns[i]].apply(lambda x: x.encode('ascii', 'ignore').decode('ascii'))
-            df_copy[df_copy.columns[i]] = df_copy[df_copy.columns[i]].astype(s)
-    recarray = df_copy.to_records(index=False)
+    obj_cols = df.select_dtypes(include='object').columns  # object, assume string .. ok for now, extend on a case by case basis as expect other stuff will error like dates
+    if len(obj_cols):
+        # assign returns a new frame, so the caller's df is never written to (column setitem on a shallow copy can write through on pandas < 1.5)
+        if fix_ascii_errors:
+            df = df.assign(**{c: df[c].str.encode('ascii', 'ignore').str.decode('ascii') for c in obj_cols})
+        df = df.assign(**{c: df[c].astype(s) for c in obj_cols})
+    recarray = df.to_records(index=False)
     _arcpy.da.NumPyArrayToTable(recarray, fname)
 
 
@@ -934,7 +1114,9 @@ def pandas_to_table2(df: _pd.DataFrame, workspace: str, tablename: str, overwrit
     Returns: None
 
     Notes:
-        Because this method first exports to csv, then it doesn't differentiate between empty strings and missing data.
+        On ArcGIS Pro 3.2+ with pyarrow installed, and when no kwargs are passed, the dataframe goes via a parquet file,
+        which keeps dtypes and nulls. Otherwise it falls back to the csv route below.
+        When exporting via csv, it doesn't differentiate between empty strings and missing data.
         This becomes an issue where fields in the underlying data are not nullable.
         Blanket solutions would result in numeric fields being interpreted as string data types.
         An untested workaround would be to write single quotes to string fields only i.e. ''.
@@ -946,9 +1128,6 @@ def pandas_to_table2(df: _pd.DataFrame, workspace: str, tablename: str, overwrit
     workspace = _path.normpath(workspace)
     _arcpy.env.workspace = workspace
     _arcpy.env.overwriteOutput = overwrite
-    tmp_file = _iolib.get_temp_fname(suffix='.csv')
-    df.replace('"', "'", inplace=True)
-    df.to_csv(tmp_file, sep=',', index=False, **kwargs)  # noqa
     fname = _iolib.fixp(workspace, tablename)
 
     if _common.is_locked(fname):
@@ -958,8 +1137,29 @@ def pandas_to_table2(df: _pd.DataFrame, workspace: str, tablename: str, overwrit
     #    _struct.fc_delete2(fname)
     if '/' in tablename or '\\' in tablename:
         tablename = _path.basename(tablename)
+        fname = _iolib.fixp(workspace, tablename)
 
-    _arcpy.conversion.TableToTable(tmp_file, workspace, tablename)  # noqa
+    # Parquet keeps dtypes and distinguishes nulls from empty strings, so prefer it where Pro can read it.
+    # kwargs are to_csv arguments, so they force the csv route.
+    if not kwargs and _parquet_export_ok():
+        tmp_file = _iolib.get_temp_fname(suffix='.parquet')
+        try:
+            df.to_parquet(tmp_file, index=False)
+            ExportTable(tmp_file, fname)  # noqa
+        except Exception:
+            _iolib.file_delete(tmp_file)
+            tmp_file = None
+    else:
+        tmp_file = None
+
+    if tmp_file is None:
+        tmp_file = _iolib.get_temp_fname(suffix='.csv')
+        # Only object columns can hold the quote. assign returns a new frame so the caller's df is untouched
+        obj_cols = df.select_dtypes(include='object').columns
+        if len(obj_cols):
+            df = df.assign(**{c: df[c].replace('"', "'") for c in obj_cols})
+        df.to_csv(tmp_file, sep=',', index=False, **kwargs)  # noqa
+        _arcpy.conversion.TableToTable(tmp_file, workspace, tablename)  # noqa
 
     if del_cols:
         with _fuckit:
@@ -967,8 +1167,40 @@ def pandas_to_table2(df: _pd.DataFrame, workspace: str, tablename: str, overwrit
     _iolib.file_delete(tmp_file)
 
 
+def _parquet_export_ok() -> bool:
+    """
+    Check if pandas_to_table2 can go via parquet.
+
+    Needs ArcGIS Pro 3.2 or later (parquet support in ExportTable) and pyarrow.
+
+    Returns:
+        bool: True if parquet can be used as the intermediary
+    """
+    try:
+        ver = tuple(int(s) for s in release().split('.')[:2])
+    except Exception:
+        return False
+    if ver < (3, 2) or 'ExportTable' not in globals():
+        return False
+    try:
+        import pyarrow  # noqa
+    except ImportError:
+        return False
+    return True
+
+
+def _field_np_dtype(fld: (_arcpy.Field, None)) -> (str, None):
+    """Get the numpy dtype for a non-nullable numeric arcpy field, else None. The dtypes match those pandas infers from the cursor values."""
+    if fld is None: return None
+    if fld.type == 'OID' or (not fld.isNullable and fld.type in ('SmallInteger', 'Integer', 'BigInteger')):
+        return '<i8'
+    if not fld.isNullable and fld.type in ('Single', 'Double'):
+        return '<f8'
+    return None
+
+
 def table_as_pandas2(fname: str, cols: (str, list) = None, where: str = None, exclude_cols: (str, list) = ('Shape',), as_int: (list, tuple) = (),
-                     as_float: (list, tuple) = (), cols_lower: bool = False, **kwargs):
+                     as_float: (list, tuple) = (), cols_lower: bool = False, chunk_size: int = 65536, **kwargs):
     """Export data in feature class/table fname to a pandas DataFrame
 
     Args:
@@ -979,6 +1211,7 @@ def table_as_pandas2(fname: str, cols: (str, list) = None, where: str = None, ex
         as_int (list, tuple, None): List of cols by name to force to int
         as_float (list, tuple, None): list of cols by name to force to float64
         cols_lower (bool): force dataframe columns to lowercase
+        chunk_size (int): Number of rows read from the cursor at a time. Ignored if kwargs are passed
         kwargs: keyword args passed to pandas.DataFrame.from_records. nrows is a useful option
 
     Returns:
@@ -1006,14 +1239,33 @@ def table_as_pandas2(fname: str, cols: (str, list) = None, where: str = None, ex
     if isinstance(cols, str): cols = [cols]
     if exclude_cols is None: exclude_cols = tuple()
 
-    def _filt(ss, col_list):
-        return ss.lower() not in map(str.lower, col_list)
-
-    flds = _struct.field_list(fname)
     if not cols:
-        cols = list(filter(lambda f: _filt(f, exclude_cols), flds))
+        excl = frozenset(map(str.lower, exclude_cols))
+        cols = [f for f in _struct.field_list(fname) if f.lower() not in excl]
 
-    df = _pd.DataFrame.from_records(data=_arcpy.da.SearchCursor(fname, cols, where_clause=where), columns=cols, **kwargs)
+    if kwargs:
+        df = _pd.DataFrame.from_records(data=_arcpy.da.SearchCursor(fname, cols, where_clause=where), columns=cols, **kwargs)
+    else:
+        # Fill non-nullable numeric columns straight into typed arrays, skipping pandas type inference on them.
+        # Nullable and other columns are left to pandas as before, so nulls are handled exactly as they were.
+        fld_objs = {f.name.lower(): f for f in _struct.field_list(fname, objects=True)}
+        # The cursor is consumed in chunks so the full list of row tuples is never held in memory.
+        dts = [_field_np_dtype(fld_objs.get(c.lower())) for c in cols]
+        parts = [[] for _ in cols]
+        with _arcpy.da.SearchCursor(fname, cols, where_clause=where) as Cur:
+            for rows in _more_itertools.chunked(Cur, chunk_size):
+                for i, dt in enumerate(dts):
+                    if dt:
+                        parts[i].append(_np.fromiter((r[i] for r in rows), dtype=dt, count=len(rows)))
+                    else:
+                        parts[i].extend(r[i] for r in rows)
+        data = {}
+        for i, c in enumerate(cols):
+            if dts[i]:
+                data[c] = _np.concatenate(parts[i]) if parts[i] else _np.empty(0, dtype=dts[i])
+            else:
+                data[c] = parts[i]
+        df = _pd.DataFrame(data, columns=cols)
 
     if isinstance(as_int, str):
         as_int = (as_int,)
@@ -1023,15 +1275,24 @@ def table_as_pandas2(fname: str, cols: (str, list) = None, where: str = None, ex
 
     for s in as_int:
         try:
-            df[s] = df[s].astype(str).astype(int)
-        except:
+            if _pd.api.types.is_integer_dtype(df[s]): continue
+            ser = _pd.to_numeric(df[s])
+        except (KeyError, ValueError, TypeError):  # KeyError, s not in df
+            ser = None
+        if ser is not None and _pd.api.types.is_integer_dtype(ser):
+            df[s] = ser.astype(int)
+        else:
             _warn('Column %s could not be coerced to type int. It probably contains nan/none/na values' % s)
 
     for s in as_float:
         try:
-            df[s] = df[s].astype(str).astype(float)
-        except:
-            _warn('Column %s could not be coerced to type int. It probably contains nan/none/na values' % s)
+            if _pd.api.types.is_float_dtype(df[s]): continue
+            df[s] = _pd.to_numeric(df[s]).astype(float)
+        except (KeyError, ValueError, TypeError):  # KeyError, s not in df
+            _warn('Column %s could not be coerced to type float. It probably contains non-numeric values' % s)
+        else:
+            if df[s].isna().any():
+                _warn('Column %s was coerced to type float but contains nan/none/na values' % s)
 
     if cols_lower:
         df.columns = df.columns.str.lower()
@@ -1146,10 +1407,17 @@ def table_as_dict(fname, cols=None, where=None, exclude_cols=('Shape', 'Shape_Le
         >>> df = table_as_dict('C:/my.gdb/fc', [OBJECTID, modified_date], where='OBJECTID>10')  # noqa
     """
     df = table_as_pandas2(fname, cols=cols, where=where, exclude_cols=exclude_cols, **kwargs)
+    # Direct columnar builds for the common orients, to_dict boxes each cell individually.
+    # Series.tolist and Series iteration both return python native scalars, as to_dict does.
+    if orient == 'list':
+        return {c: df[c].tolist() for c in df.columns}
+    if orient == 'records':
+        cols_ = list(df.columns)
+        return [dict(zip(cols_, row)) for row in zip(*(df[c] for c in cols_))]  # noqa
     return df.to_dict(orient=orient)
 
 
-def table_dump_from_sde_to_excel(sde_file: str, lyr, xlsx_root_folder: str, **kwargs) -> str:
+def table_dump_from_sde_to_excel(sde_file: str, lyr, xlsx_root_folder: str, fmt: str = 'xlsx', **kwargs) -> str:
     """
     Dump Enterprise geodatabase layer defined by sde connection file to excel.
     The excel file name is generated from current date and the source layer name.
@@ -1158,22 +1426,39 @@ def table_dump_from_sde_to_excel(sde_file: str, lyr, xlsx_root_folder: str, **kw
         sde_file (str): SDE file
         lyr (str): feature class/table name.
         xlsx_root_folder (str): Root folder in which to save the xlsx
+        fmt (str): Output format, one of 'xlsx', 'parquet' or 'feather'. parquet and feather are much faster to write than xlsx for large layers, and need pyarrow.
         kwargs (any): Passed to data.table_as_pandas2
 
+    Raises:
+        ValueError: If fmt is not supported
+
     Returns:
-        str: The excel file name.
+        str: The excel file name (or parquet/feather file name if fmt was set).
 
     Examples:
         >>> table_dump_from_sde_to_excel('C:/my.sde', 'MyDataTable')
+
+        Dump to parquet, for archiving
+
+        >>> table_dump_from_sde_to_excel('C:/my.sde', 'MyDataTable', 'C:/dumps', fmt='parquet')
     """
+    fmt = fmt.lower()
+    if fmt not in ('xlsx', 'parquet', 'feather'):
+        raise ValueError('fmt must be one of "xlsx", "parquet" or "feather", got "%s"' % fmt)
+
     sde_file = _iolib.fixp(sde_file, lyr)
-    dest_xlsx = _iolib.fixp(xlsx_root_folder,
-                            '%s_%s.xlsx' % (_iolib.pretty_date_now(with_time=True, time_sep=''), lyr)
-                            )
+    dest = _iolib.fixp(xlsx_root_folder,
+                       '%s_%s.%s' % (_iolib.pretty_date_now(with_time=True, time_sep=''), lyr, fmt)
+                       )
 
     df = table_as_pandas2(sde_file, **kwargs)
-    df.to_excel(dest_xlsx)
-    return dest_xlsx
+    if fmt == 'parquet':
+        df.to_parquet(dest, compression='zstd')
+    elif fmt == 'feather':
+        df.reset_index(drop=True).to_feather(dest)  # feather only supports a default index
+    else:
+        df.to_excel(dest)
+    return dest
 
 
 def duplicate_rows(src: str, dest: str, cols_for_func: (str, list[str]), func, key_field, where: (str, None) = None, allow_overwrite: bool = False) -> list[any]:
@@ -1344,6 +1629,8 @@ def field_update_from_dict(fname: str, dict_: dict, col_to_update: str, key_col:
     Notes:
         Use data.df_to_dict (direct import of funclite.pandaslib.df_to_dict_as_records_flatten1) to convert a dataframe to the required format to
         be consumed by this function.
+        When key_col is also col_to_update, na is left as default, no edit session is needed and dict_ has at most 500 scalar values,
+        the update is done with a single CalculateField call rather than an update cursor.
 
     Examples:
         >>> fc = 'c:\\foo\\bar.shp'
@@ -1371,47 +1658,92 @@ def field_update_from_dict(fname: str, dict_: dict, col_to_update: str, key_col:
 
     cnt = 0
 
-    n = get_row_count2(fname, where)
-    if n == 0:
-        _warn('No records matched where query "%s" in %s. Did you expect this?' % (where, fname))
+    # When unmatched rows are left as is, let the database skip them rather than reading every row through the cursor.
+    # A modest number of int or quote free str keys go in an IN clause, which query_where_in can safely render.
+    # Larger sets of int keys are bounded by a range instead, which the key index (e.g. the OID) can serve.
+    # The predicate is only added when the key types match the key field type, e.g. int keys against a text field would be a type error in the database.
+    # OID@ is a cursor token, so resolve it to the real oid field name for use in SQL.
+    where_in = False
+    sql_key = _arcpy.Describe(fname).OIDFieldName if key_col.upper() == 'OID@' else key_col
+    if identity and dict_:
+        where_keys = None
+        key_type = next((f.type for f in _arcpy.ListFields(fname) if f.name.lower() == sql_key.lower()), None)
+        int_keys = key_type in ('OID', 'SmallInteger', 'Integer', 'BigInteger', 'Single', 'Double') and all(isinstance(k, int) and not isinstance(k, bool) for k in dict_)
+        str_keys = key_type in ('String', 'GUID', 'GlobalID') and all(isinstance(k, str) and "'" not in k for k in dict_)
+        if len(dict_) <= 1000 and (int_keys or str_keys):
+            where_keys = _sql.query_where_in(sql_key, list(dict_.keys()))
+            where_in = True
+        elif int_keys:
+            where_keys = '%s BETWEEN %s AND %s' % (sql_key, min(dict_), max(dict_))
+        if where_keys:
+            where = '(%s) AND (%s)' % (where, where_keys) if where else where_keys
+
+    # Evaluate once, fc_in_toplogy walks every topology in the gdb
+    use_edit = bool(_arcpy.env.workspace) or _struct.fc_in_toplogy(fname)  # debug the fc_in_topology call
+
+    # Recoding a column in place from a small dict. Every row in the IN filtered view is a match, so hand the
+    # mapping to CalculateField as a codeblock and let it update the rows in one set-based call.
+    # Values must round trip through repr, so only finite scalars are accepted. The dict is rendered into the
+    # codeblock with %r, so it is capped at 500 items to keep the codeblock a sensible size.
+    # CalculateField runs outside an Editor session, so it is only used when an edit session is not required.
+    if selfupdate and where_in and not use_edit and not show_progress and len(dict_) <= 500 and \
+            all(v is None or isinstance(v, (int, str)) or (isinstance(v, float) and _math.isfinite(v)) for v in dict_.values()):
+        vw = _stringslib.rndstr(from_=_string.ascii_lowercase)
+        try:
+            _arcpy.management.MakeTableView(fname, vw, where_clause=where)
+            cnt = int(_arcpy.management.GetCount(vw)[0])
+            if cnt == 0:
+                _warn('No records matched where query "%s" in %s. Did you expect this?' % (where, fname))
+            else:
+                codeblock = 'def _map(v, d=%r):\n    return d.get(v, v)' % (dict_,)
+                _arcpy.management.CalculateField(vw, col_to_update, '_map(!%s!)' % sql_key, 'PYTHON3', codeblock)
+        finally:
+            with _fuckit:
+                _arcpy.management.Delete(vw)
+        return cnt
 
+    # get_row_count2 walks a cursor, so only count up front when a progress bar needs the maximum. Otherwise the cursor loop counts rows as it goes.
     if show_progress:
+        n = get_row_count2(fname, where)
+        if n == 0:
+            _warn('No records matched where query "%s" in %s. Did you expect this?' % (where, fname))
         PP = _iolib.PrintProgress(maximum=n, init_msg=init_msg)
 
-    if _arcpy.env.workspace or _struct.fc_in_toplogy(fname):  # debug the fc_in_topology call
+    if use_edit:
         edit = _arcpy.da.Editor(_arcpy.env.workspace)
         edit.startEditing(False, False)
         edit.startOperation()
 
     # if you are here debugging an unexplained da.UpdateCursor invalid col error - check the where clause - you get an invalid col error if there are Nones in an IN query e.g. cola in (None,'a')
+    ix = 0 if selfupdate else 1  # index in row of the col to update, decided once rather than per row
     with _arcpy.da.UpdateCursor(fname, cols, where_clause=where) as uc:
-        for row in uc:
-            ido = row[0]
-            if identity:
-                # branch that leaves unmatched records unchanged if na = (1,1)
-                if ido in dict_:
-                    newval = dict_[ido]
-                    if selfupdate:
-                        row[0] = newval
-                    else:
-                        row[1] = newval
+        if identity:
+            # leaves unmatched records unchanged if na = (1,1)
+            miss = object()  # sentinel, so a single dict probe tells us both membership and value (values may legitimately be None)
+            nrows = 0
+            for row in uc:
+                nrows += 1
+                newval = dict_.get(row[0], miss)
+                if newval is not miss:
+                    row[ix] = newval
                     uc.updateRow(row)
                     cnt += 1
-                else:
-                    pass
-            else:
-                # branch that sets unmatched records to na
-                newval = dict_.get(ido, na)
-                if selfupdate:
-                    row[0] = newval
-                else:
-                    row[1] = newval
+                if show_progress:
+                    PP.increment()  # noqa
+        else:
+            # sets unmatched records to na
+            for row in uc:
+                row[ix] = dict_.get(row[0], na)
                 uc.updateRow(row)
                 cnt += 1
-            if show_progress:
-                PP.increment()  # noqa
+                if show_progress:
+                    PP.increment()  # noqa
+            nrows = cnt
 
-    if _arcpy.env.workspace or _struct.fc_in_toplogy(fname):
+    if nrows == 0 and not show_progress:
+        _warn('No records matched where query "%s" in %s. Did you expect this?' % (where, fname))
+
+    if use_edit:
         edit.stopOperation()  # noqa
         if edit.isEditing:
             edit.stopEditing(save_changes=True)  # noqa
@@ -1515,56 +1847,51 @@ def fields_copy_by_join(fc_dest: str, fc_dest_key_col: str, fc_src: str, fc_src_
         if d:
             raise _errors.StructFieldExists('error_if_dest_cols_exists was True and field(s) %s already exist in destination %s' % (fc_dest, str(d)))
 
-    if not allow_duplicates_in_pk:
-        if field_has_duplicates(fc_src, fc_src_key_col):
-            raise _errors.DataFieldValuesNotUnique('Field values in "%s", field %s must be unique.' % (fc_src, fc_src_key_col))
-
-    # join_list may now be out of order with rename_to. NB join_list_temp is a list of Field instances, not a string
-    join_list_temp = [f for f in _arcpy.ListFields(fc_src) if f.name.lower() in cols_to_copy]
-    if len(join_list_temp) != len(cols_to_copy):
+    # NB join_list is a list of Field instances, not a string. Built in cols_to_copy order, so our source data cols match order of rename_to
+    fields_by_name = {f.name.lower(): f for f in _arcpy.ListFields(fc_src)}
+    missing = [c for c in cols_to_copy if c not in fields_by_name]
+    if missing:
         raise ValueError(
-            'Expected %s fields in source, got %s. Check the names of the columns you have asked to copy. Field name comparisons are case sensitive here.' % (len(cols_to_copy), len(join_list_temp)))
-
-    # create join_list, restoring order, so our source data cols match order of rename_to
-    join_list = [None] * len(cols_to_copy)
-    for f in join_list_temp:
-        join_list[cols_to_copy.index(f.name.lower())] = f
-
-    # ######################################
-    # Add fields to be copied to destination
-    # ######################################
-    if show_progress:
-        PP = _iolib.PrintProgress(iter_=join_list, init_msg='Copying field definitions to destination (as required) ...')
-
-    for i, f in enumerate(join_list):
-        _struct.field_copy_definition(fc_src, fc_dest, f.name, rename_to[i], silent_skip_on_exists=not error_if_dest_cols_exists)  # noqa
-        if show_progress:
-            PP.increment()  # noqa
+            'Expected %s fields in source, got %s. Check the names of the columns you have asked to copy. Missing: %s' % (len(cols_to_copy), len(cols_to_copy) - len(missing), missing))
+    join_list = [fields_by_name[c] for c in cols_to_copy]
 
     # #################################
     # Now read src records into a dict
     # #################################
     src_rows_dict = {}
-    if ignore_type_on_lookup:
-        f_ignore = lambda vv: str(vv)
-    else:
-        f_ignore = lambda vv: vv
+    # str directly rather than wrapped in a lambda, and no call at all when types are matched as is
+    f_ignore = str if ignore_type_on_lookup else None
 
     cols_to_copy.insert(0, fc_src_key_col)  # just add the src primary key to the start of cols_to_copy
 
     if show_progress:
-        PP = _iolib.PrintProgress(maximum=get_row_count(fc_src), init_msg='2 of 3. Reading data from source ...')
+        PP = _iolib.PrintProgress(maximum=get_row_count(fc_src), init_msg='1 of 3. Reading data from source ...')
 
-    pkvalues = []
+    # The source is read before any change is made to the destination schema, so the duplicate pk check
+    # still fails early, but without a separate pass over the source just to look for duplicates.
     with _arcpy.da.SearchCursor(fc_src, cols_to_copy) as srows:
         for srow in srows:
             # create dict .... {'row 1 key value': (row 1 field 1 value, row 1 field 2 value ...), 'row key value 2': (...)}
-            if not srow[0] in pkvalues:  # don't add if we have duplicate primary key values, as can happen if allow_duplicates_in_pk == True
-                src_rows_dict[f_ignore(srow[0])] = tuple(srow[1:])  # f_ignore making all keys strings if we want to ignore type matching on PK/FK
-                pkvalues += [srow[0]]
+            k = srow[0] if f_ignore is None else f_ignore(srow[0])  # f_ignore making all keys strings if we want to ignore type matching on PK/FK
+            if k not in src_rows_dict:
+                src_rows_dict[k] = tuple(srow[1:])
+            elif not allow_duplicates_in_pk:
+                raise _errors.DataFieldValuesNotUnique('Field values in "%s", field %s must be unique.' % (fc_src, fc_src_key_col))
+            # else a duplicate primary key value, keep the first row, as can happen if allow_duplicates_in_pk == True
             if show_progress:
                 PP.increment()  # noqa
 
+    # ######################################
+    # Add fields to be copied to destination
+    # ######################################
+    if show_progress:
+        PP = _iolib.PrintProgress(iter_=join_list, init_msg='2 of 3. Copying field definitions to destination (as required) ...')
+
+    for i, f in enumerate(join_list):
+        _struct.field_copy_definition(fc_src, fc_dest, f.name, rename_to[i], silent_skip_on_exists=not error_if_dest_cols_exists)  # noqa
+        if show_progress:
+            PP.increment()  # noqa
+
     ####################################################
     # Write the records from the dict to the destination
     ####################################################
@@ -1576,13 +1903,15 @@ def fields_copy_by_join(fc_dest: str, fc_dest_key_col: str, fc_src: str, fc_src_
 
     with _arcpy.da.UpdateCursor(fc_dest, rename_to) as urows:
         for row in urows:
-            if f_ignore(row[0]) in map(f_ignore,
-                                       src_rows_dict.keys()):  # map is just so we convert everything to a string for comparisons, ignoring stuff like one PK field is an int and the FK field is a string.
-                for i, v in enumerate(src_rows_dict[f_ignore(row[0])]):
+            # keys in src_rows_dict already went through f_ignore, so a dict lookup does the type-insensitive match
+            vals = src_rows_dict.get(row[0] if f_ignore is None else f_ignore(row[0]))
+            if vals is not None:
+                for i, v in enumerate(vals):
                     row[i + 1] = v  # first row is the foreign key col we inserted earlier. So shift index up 1
                 urows.updateRow(row)
                 n += 1
-            PP.increment()
+            if show_progress:
+                PP.increment()  # noqa
     return n
 
 
@@ -1605,6 +1934,7 @@ def fields_apply_func(fname, cols, *args, where_clause=None, show_progress=False
 
     Notes:
         TIP: Use inspect.getfullargspec(<func>).args to get a function argument lists when calling this function.
+        Rows whose values are unchanged by the functions are not written back, but are still counted in the return value.
 
     Examples:
         >>> f1 = str.lower: f2 = str.upper
@@ -1621,26 +1951,31 @@ def fields_apply_func(fname, cols, *args, where_clause=None, show_progress=False
         # Specifically, updates must be put in an edit session, otherwise arcpy raises
         # an error about not being able to make changes outside of an edit session
         # Hence the following code triggering an edit session if we have a workspace
-        if _arcpy.env.workspace:
+        use_edit = bool(_arcpy.env.workspace)
+        if use_edit:
             edit = _arcpy.da.Editor(_arcpy.env.workspace)
             edit.startEditing(False, False)
             edit.startOperation()
 
         n = 0
+
+        # Chain the functions once, so each cell goes through a single call rather than one list per function
+        if len(args) == 1:
+            fchain = args[0]
+        else:
+            fchain = lambda v: _functools.reduce(lambda acc, f: f(acc), args, v)
+
         with _arcpy.da.UpdateCursor(fname, cols, where_clause=where_clause) as cursor:
-            for i, row in enumerate(cursor):
-                vals = [row[j] for j in range(len(cols))]
-                for f in args:  # function chaining
-                    vals = [f(v) for v in vals]  # pass in our function to correct the data
-
-                for k, v in enumerate(vals):
-                    row[k] = v
-                cursor.updateRow(row)
+            for row in cursor:
+                # The cursor is opened on cols only, so the row is exactly the values to transform
+                new_row = list(map(fchain, row))
+                if new_row != row:  # skip the write for rows the functions left unchanged
+                    cursor.updateRow(new_row)
                 if show_progress:
                     PP.increment()  # noqa
                 n += 1
 
-        if _arcpy.env.workspace:
+        if use_edit:
             edit.stopOperation()  # noqa
             if edit.isEditing:
                 edit.stopEditing(save_changes=True)  # noqa
@@ -1657,7 +1992,7 @@ def fields_apply_func(fname, cols, *args, where_clause=None, show_progress=False
 
 # this could be extended to allow multi argument functions by providing named arguments
 # to pass thru
-def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str, func, where_clause: (str, None) = None, show_progress: bool = False) -> int:
+def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str, func, where_clause: (str, None) = None, show_progress: bool = False, vectorized: bool = False) -> int:
     """
     Very similiar to ArcPro's Calculate Field.
     Take in_cols values, apply a function to these values to recalculate col_to_update.
@@ -1674,17 +2009,26 @@ def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str,
         where_clause (str): applied to filter rows to be updated (STATE="Washington")
         show_progress (bool): Have this func print a progress bar to the console
 
+        vectorized (bool):
+            Call func once, passing each of arg_cols as a numpy array, rather than once per row.
+            func must be written with operations that broadcast over numpy arrays, e.g. arithmetic, comparisons, numpy ufuncs and numpy.where.
+            Branching (if/else, and/or), str methods and None handling will not work, use the default per-row path for these.
+
     Returns:
         int: Number of records processed
 
     Notes:
         arcproapi.structure exposes AddField, use this to add your field to recalculate if it doesnt exist!
         TIP: Use inspect.getfullargspec(<func>).args to get a function argument list when calling this function.
+        With vectorized=True, columns with nulls are read as object arrays, so arithmetic will fail on the None values.
 
     Examples:
         Set field "coord_sum" to be the product of fields easting, northing, elevation for all rows in Bangor.
         >>> f1 = lambda x, y, z: x + y + z
         >>> field_recalculate('c:/my.shp', ['easting','northing', 'elevation'], 'coord_sum', f1, where_clause='town="bangor"')
+
+        As above, but the lambda is called once with numpy arrays
+        >>> field_recalculate('c:/my.shp', ['easting','northing', 'elevation'], 'coord_sum', f1, where_clause='town="bangor"', vectorized=True)
     """
     isedit = False
     fc = _path.normpath(fc)
@@ -1694,6 +2038,11 @@ def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str,
 
     if isinstance(arg_cols, str): arg_cols = [arg_cols]
     if isinstance(arg_cols, tuple): arg_cols = list(arg_cols)
+
+    vals_by_oid = None
+    if vectorized:
+        vals_by_oid = _field_values_vectorized(fc, arg_cols, func, where_clause)
+
     j = 0
     try:
         # Update cursor behaves differently the environment has a workspace set
@@ -1701,21 +2050,32 @@ def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str,
         # an error about not being able to make changes outside of an edit session
         # Hence the following code triggering an edit session if we have a workspace
         # Also if the layer is in a topology, then it can only be edited in an Editor session
-        if _arcpy.env.workspace or _struct.fc_in_toplogy(fc):
+        # Evaluated once, fc_in_toplogy walks every topology in the gdb
+        use_edit = bool(_arcpy.env.workspace) or _struct.fc_in_toplogy(fc)
+        if use_edit:
             edit = _arcpy.da.Editor(_arcpy.env.workspace)
             edit.startEditing(False, False)
             edit.startOperation()
             isedit = True
 
-        with _arcpy.da.UpdateCursor(fc, arg_cols + [col_to_update], where_clause=where_clause) as cursor:
-            for i, row in enumerate(cursor):
-                row[-1] = func(*row[0:len(arg_cols)])
-                cursor.updateRow(row)
-                if show_progress:
-                    PP.increment()  # noqa
-                j += 1
-
-        if _arcpy.env.workspace or _struct.fc_in_toplogy(fc):
+        if vectorized:
+            with _arcpy.da.UpdateCursor(fc, ['OID@', col_to_update], where_clause=where_clause) as cursor:
+                for row in cursor:
+                    row[1] = vals_by_oid[row[0]]
+                    cursor.updateRow(row)
+                    if show_progress:
+                        PP.increment()  # noqa
+                    j += 1
+        else:
+            with _arcpy.da.UpdateCursor(fc, arg_cols + [col_to_update], where_clause=where_clause) as cursor:
+                for i, row in enumerate(cursor):
+                    row[-1] = func(*row[0:len(arg_cols)])
+                    cursor.updateRow(row)
+                    if show_progress:
+                        PP.increment()  # noqa
+                    j += 1
+
+        if use_edit:
             edit.stopOperation()  # noqa
             if edit.isEditing:
                 edit.stopEditing(save_changes=True)  # noqa
@@ -1734,6 +2094,36 @@ def field_recalculate(fc: str, arg_cols: (str, list, tuple), col_to_update: str,
 field_apply_func = field_recalculate  # noqa For convieniance. Original func left in to not break code
 
 
+def _field_values_vectorized(fname: str, arg_cols: list[str], func, where_clause: (str, None) = None) -> dict:
+    """
+    Read arg_cols as numpy arrays and call func once with them.
+
+    Args:
+        fname (str): feature class/table
+        arg_cols (list[str]): columns, each is passed to func as a numpy array, in order
+        func: function which broadcasts over numpy arrays
+        where_clause (str, None): where clause
+
+    Raises:
+        ValueError: If func did not return a scalar or an array matching the number of rows read
+
+    Returns:
+        dict: Result of func, keyed on OID. Values are python types, as required by arcpy cursors.
+    """
+    with _arcpy.da.SearchCursor(fname, ['OID@'] + arg_cols, where_clause=where_clause) as SC:
+        rows = list(SC)
+    if not rows:
+        return {}
+
+    cols = list(zip(*rows))
+    res = _np.asarray(func(*[_np.asarray(c) for c in cols[1:]]))
+    if res.ndim == 0:
+        res = _np.broadcast_to(res, len(rows))
+    if len(res) != len(rows):
+        raise ValueError('The vectorized func returned %s values for %s rows' % (len(res), len(rows)))
+    return dict(zip(cols[0], res.tolist()))
+
+
 def field_apply_and_add(fname: str, in_fields: (list[str], str), new_field: str, func, field_type: (str, None) = None, field_length: (int, None) = None, allow_edit: bool = False,
                         show_progress: bool = True, where=None, **kwargs) -> int:
     """ Add the square type based on sq_id.
@@ -1753,7 +2143,7 @@ def field_apply_and_add(fname: str, in_fields: (list[str], str), new_field: str,
     Raises:
         ValueError: If allow_edit was False but new_field already exists
         ValueError: If allow_edit was False and no field_type was specified
-        ValueError: If field_type not in ['TEXT', 'FLOAT', 'REAL', 'SHORT', 'LONG', 'DATE', 'DATETIME']
+        ValueError: If field_type not in ['TEXT', 'FLOAT', 'DOUBLE', 'SHORT', 'LONG', 'DATE', 'DATETIME']
 
     Returns:
         int: Number of records edited
@@ -1761,6 +2151,8 @@ def field_apply_and_add(fname: str, in_fields: (list[str], str), new_field: str,
     Notes:
         Ultimately looks up if is a CS square from erammp.data.
         If there are invalid sq_ids, a warning message will be printed ot the console
+        When a new SHORT, LONG, FLOAT, DOUBLE or TEXT field is created (and no kwargs are passed), func is applied once per row and the values are written
+        in a single arcpy.da.ExtendTable call, or through an update cursor if numpy cannot hold them exactly. Otherwise this falls back to AddField and field_recalculate.
 
 
     Examples:
@@ -1773,24 +2165,94 @@ def field_apply_and_add(fname: str, in_fields: (list[str], str), new_field: str,
     if not field_type and not allow_edit:
         raise ValueError('allow_edit was False and no field_type was specified')
 
-    if field_type and field_type.lower() not in ['text', 'float', 'short', 'date', 'datetime', 'long']:
-        raise ValueError("field_type only supports ['TEXT', 'FLOAT', 'REAL', 'SHORT', 'LONG', 'DATE', 'DATETIME'].")
+    if field_type and field_type.lower() not in ['text', 'float', 'double', 'short', 'date', 'datetime', 'long']:
+        raise ValueError("field_type only supports ['TEXT', 'FLOAT', 'DOUBLE', 'SHORT', 'LONG', 'DATE', 'DATETIME'].")
     fname = _path.normpath(fname)
 
     if isinstance(in_fields, str): in_fields = [in_fields]
-
-    if allow_edit:
-        if not _struct.field_exists(fname, new_field):
-            _struct.AddField(fname, new_field, field_type, field_length=field_length, **kwargs)
-    else:
-        # Check first so can raise a known error rather than generic arcpy one
-        if _struct.field_exists(fname, new_field):
-            raise ValueError('Field "%s" already exists and allow_edit was False.' % new_field)
+    if isinstance(in_fields, tuple): in_fields = list(in_fields)
+
+    # Check first so can raise a known error rather than generic arcpy one
+    exists = _struct.field_exists(fname, new_field)
+    if exists and not allow_edit:
+        raise ValueError('Field "%s" already exists and allow_edit was False.' % new_field)
+
+    if not exists:
+        # kwargs are AddField options (alias, nullable etc.) that ExtendTable cannot honour
+        if not kwargs:
+            i = _field_extend_by_func(fname, in_fields, new_field, func, field_type, field_length=field_length, where=where, show_progress=show_progress)
+            if i is not None:
+                return i
         _struct.AddField(fname, new_field, field_type, field_length=field_length, **kwargs)
+
     i = field_recalculate(fname, in_fields, new_field, func, show_progress=show_progress, where_clause=where)
     return i
 
 
+def _field_extend_by_func(fname: str, in_fields: list[str], new_field: str, func, field_type: str, field_length: (int, None) = None, where: (str, None) = None,
+                          show_progress: bool = False) -> (int, None):
+    """
+    Create new_field in fname, populated with func(*in_fields), using a single arcpy.da.ExtendTable call joined on the OID.
+    This avoids the AddField + row-by-row UpdateCursor write used by field_recalculate.
+
+    Args:
+        fname (str): feature class/table name, already normpathed
+        in_fields (list[str]): fields whose values are passed to func
+        new_field (str): Name of the field to create, must not already exist
+        func: The function to apply
+        field_type (str): The field type, only SHORT, LONG, FLOAT, DOUBLE and TEXT are supported
+        field_length (int, None): length of text fields, defaults to 255
+        where (str, None): where clause, rows not matching the where are left null
+        show_progress (bool): Print a status message
+
+    Returns:
+        int: Number of records written
+        None: If nothing was written and func was not called, and the caller should fall back to AddField + field_recalculate.
+            This happens when the field type is not supported or fname is in a topology, or when no rows matched.
+
+    Notes:
+        func is called exactly once per row. If numpy cannot hold the results exactly (func returned None, which numpy arrays cannot carry,
+        a value would be truncated or cast to fit the field type), the field is added with AddField and the results written with field_update_from_dict.
+        See https://pro.arcgis.com/en/pro-app/latest/arcpy/data-access/extendtable.htm
+    """
+    if not field_type:
+        return None
+
+    field_type = field_type.lower()
+    if field_type == 'text':
+        field_length = field_length if field_length else 255
+        dtype = '<U%s' % field_length
+    else:
+        dtype = {'short': '<i2', 'long': '<i4', 'float': '<f4', 'double': '<f8'}.get(field_type)
+
+    if not dtype or _struct.fc_in_toplogy(fname):
+        return None
+
+    if show_progress: print('\nApplying func "%s" to new column "%s" ...' % (getattr(func, '__name__', ''), new_field))
+    oids, vals = [], []
+    with _arcpy.da.SearchCursor(fname, ['OID@'] + in_fields, where_clause=where) as SC:
+        for row in SC:
+            oids.append(row[0])
+            vals.append(func(*row[1:]))
+
+    if not oids:
+        return None
+
+    # Same hazard as tuple_list_to_table, numpy assignment silently truncates text and casts floats and numeric strings into ints
+    if not _numpy_values_safe(vals, _np.dtype(dtype)):
+        _struct.AddField(fname, new_field, field_type, field_length=field_length)
+        field_update_from_dict(fname, dict(zip(oids, vals)), new_field, key_col=_struct.field_oid(fname), where=where)
+        return len(oids)
+
+    join_fld = '_oid_%s' % _stringslib.rndstr(from_=_string.ascii_lowercase)
+    arr = _np.empty(len(oids), dtype=[(join_fld, '<i4'), (new_field, dtype)])
+    arr[join_fld] = oids
+    arr[new_field] = vals
+
+    _arcpy.da.ExtendTable(fname, _struct.field_oid(fname), arr, join_fld)
+    return len(oids)
+
+
 def memory_lyr_get(workspace='in_memory') -> str:
     """ Just get an 8 char string to use as name for temp layer.
 
@@ -1829,6 +2291,7 @@ def del_rows(fname: str, cols: any, vals: any, where: str = None, show_progress:
         This has not been tested with date strings passed to vals.
         Ensure vals are nested lists if not using single value, e.g. use: [[''], ['']] - NOT ['','']
         Multiple criteria is an (obviously) OR match, see examples.
+        Wildcard deletes (vals='*') are made in a single call to arcpy.management.DeleteRows against a table view filtered by where.
 
     Examples:
 
@@ -1858,34 +2321,56 @@ def del_rows(fname: str, cols: any, vals: any, where: str = None, show_progress:
         vals = [[vals]]
 
     fname = _path.normpath(fname)
+
+    # Wildcard delete, no need to iterate rows in python. Let DeleteRows do it in one call against a view filtered by the where
+    if vals == '*':
+        vw = _stringslib.rndstr(from_=_string.ascii_lowercase)
+        try:
+            _arcpy.management.MakeTableView(fname, vw, where_clause=where)
+            j = int(_arcpy.management.GetCount(vw)[0])
+            if show_progress: print('\nDeleting %s rows from %s ...' % (j, fname))
+            if j:
+                _arcpy.management.DeleteRows(vw)
+        finally:
+            with _fuckit:
+                _arcpy.management.Delete(vw)
+        return j
+
     if show_progress:
         PP = _iolib.PrintProgress(maximum=get_row_count2(fname, where))  # noqa
 
     j = 0
-    with _arcpy.da.UpdateCursor(fname, cols, where_clause=where) as C:
-        if vals == '*':
-            for _ in C:
-                C.deleteRow()
-                j += 1
-                if show_progress:
-                    PP.increment()  # noqa
-        else:
+    if vals is None:
+        criteria = [[None]]
+    else:
+        criteria = tuple(zip(*vals))
+
+    # A set of criteria tuples gives one hashed lookup per row, rather than testing every criteria tuple in turn.
+    # Hashed equality matches == for the scalar values cursors return (e.g. 1 == 1.0).
+    # The set only matches whole rows, so it is used only when every criteria tuple has a value for each col.
+    # Shorter criteria (e.g. vals=None with several cols gives [[None]]) are matched pairwise, which compares only the leading cols.
+    crit_set = None
+    if all(len(crit) == len(cols) for crit in criteria):
+        try:
+            crit_set = frozenset(tuple(crit) for crit in criteria)
+        except TypeError:  # unhashable values in vals, fall back to the pairwise comparison
+            pass
 
-            if vals is None:
-                criteria = [[None]]
+    with _arcpy.da.UpdateCursor(fname, cols, where_clause=where) as C:
+        for row in C:
+            if crit_set is not None:
+                if tuple(row) in crit_set:
+                    C.deleteRow()
+                    j += 1
             else:
-                criteria = tuple(zip(*vals))
-
-            for i, row in enumerate(C):
                 for crit in criteria:
-                    all_ = ([crit[k] == row[k] for k in range(len(crit))])
-                    if all(all_):
+                    if all(a == b for a, b in zip(crit, row)):  # short-circuits on first mismatch
                         C.deleteRow()
                         j += 1
                         break
 
-                if show_progress:
-                    PP.increment()  # noqa
+            if show_progress:
+                PP.increment()  # noqa
     return j
 
 
@@ -1941,10 +2426,14 @@ def pandas_join_multi(dfs: list, key: str) -> _pd.DataFrame:
     Examples:
           >>> pandas_join_multi([df1, df2, df3], key='objectid')  # noqa
     """
-    df_first = dfs[0]
+    # Same result as chaining pandas_join, but the accumulated frame stays indexed on key
+    # rather than having its index reset and set again for every join.
+    drop_wildcard = '__'
+    out = dfs[0].set_index(key)
     for df in dfs[1:]:
-        df_first = pandas_join(df_first, df, from_key=key, to_key=key)
-    return df_first
+        out = out.join(df.set_index(key), how='left', rsuffix=drop_wildcard)
+        out.drop(list(out.filter(regex=drop_wildcard)), axis=1, inplace=True)  # drop duplicate cols
+    return out.reset_index()
 
 
 # These are also in funclite.pandaslib, but reproduce them here.
@@ -1974,32 +2463,56 @@ def pandas_join(from_: _pd.DataFrame, to_: _pd.DataFrame, from_key: str, to_key:
     return join
 
 
-def features_copy_to_new(source: str, dest: str, where_clause: (None, str) = None, **kwargs):
+def features_copy_to_new(source: str, dest: str, where_clause: (None, str) = None, fast: bool = False, **kwargs):
     """
     Copy features to a new source based on a where clause.
-    Calls arcpy.analysis.Select, which recieves the kwargs
 
     Args:
         source (str): Source layer, normpathed
         dest (str): Destination, normpathed
         where_clause (None, str): Where clause to select records for copying
+
+        fast (bool):
+            Create dest from the schema of source, then pipe matching rows from a SearchCursor straight into an InsertCursor.
+            This avoids the geoprocessing overhead of arcpy.analysis.Select.
+            Off by default, as read-only values are not copied, see Notes. Ignored if kwargs are passed, as they are Select arguments.
+
         kwargs: Keyword arguments, passed to arcpy.analysis.Select
 
     Returns:
         None
 
+    Notes:
+        The fast path copies editable fields and the shape only. Read-only fields such as GlobalID and editor tracking fields are regenerated by dest,
+        so only use it where those values do not need to be kept.
+
     # TODO Debug features_copy_to_new
     """
     source = _path.normpath(source)
     dest = _path.normpath(dest)
-    oids_to_select = []
 
-    with _arcpy.da.SearchCursor(source, ['OID@'], where_clause=where_clause) as cursor:
-        for row in cursor:
-            oids_to_select.append(row[0])
+    if fast and not kwargs:
+        D = Describe(source)
+        is_table = D['datasetType'] == 'Table'
+        if is_table:
+            _struct.CreateTable(_path.dirname(dest), _path.basename(dest), template=source)
+        else:
+            _struct.CreateFeatureclass(_path.dirname(dest), _path.basename(dest), geometry_type=D['shapeType'].upper(), template=source,
+                                       has_m='ENABLED' if D['hasM'] else 'DISABLED', has_z='ENABLED' if D['hasZ'] else 'DISABLED',
+                                       spatial_reference=D['spatialReference'])
+
+        flds = _struct.fc_fields_editable(source, full_name=False, exclude_shape=not is_table)
+        if not is_table:
+            flds.append('SHAPE@')
+
+        with _arcpy.da.SearchCursor(source, flds, where_clause=where_clause) as SC, _arcpy.da.InsertCursor(dest, flds) as IC:
+            for row in SC:
+                IC.insertRow(row)
+        return
 
-    sql = "{0} IN {1}".format(_arcpy.AddFieldDelimiters(source, _arcpy.Describe(source).OIDFieldName), tuple(oids_to_select))
-    _arcpy.analysis.Select(source, dest, sql, **kwargs)  # noqa
+    # Select evaluates where_clause itself, so there is no need to resolve it to an OID IN (...) list first.
+    # That list broke on 1 oid (trailing comma), 0 oids and on backends which cap IN list lengths.
+    _arcpy.analysis.Select(source, dest, where_clause, **kwargs)  # noqa
 
 
 def features_delete_orphaned(parent: str, parent_field: str, child: str, child_field: str) -> None:
@@ -2023,8 +2536,12 @@ def features_delete_orphaned(parent: str, parent_field: str, child: str, child_f
     """
     oids = key_info(parent, parent_field, child, child_field, as_oids=True)['child_only']
     if oids:
+        # OID@ is a cursor token, not a field name, so the where needs the real OID field name.
+        # Ranges over runs of consecutive oids keep the clauses short, rather than one IN list of every orphan.
+        oidfld = _arcpy.Describe(child).OIDFieldName
         with _crud.CRUD(child, enable_transactions=False) as crud:
-            crud.deletew(_sql.query_where_in('OID@', oids))
+            for where in _sql.query_where_in_ranges(oidfld, oids):
+                crud.deletew(where)
 
 
 # Devnote - it is better to use copy_shape here, Python does not support "Shape@ =" as a kwarg (@ is invalid) and so using this design decision means the caller does not have to know the name of the shape field in "fname".
@@ -2076,6 +2593,9 @@ def features_copy(source: str, dest: str, workspace: str, where_clause: str = '*
         This action is wrapped in a transaction, if any one row fails to add
         (e.g. because a duplicate row would be created and fail_on_exists==True), then all
         changes will be rolled back
+        With enable_transactions=False (the default), and either force_add=True or fail_on_exists=True, rows are written with a single
+        arcpy.da.InsertCursor rather than through the ORM. If existence is checked (force_add=False), the existing dest records are read once
+        up front and each row is checked against them in python, so the match is an exact value match over all written fields except the shape.
 
     Examples:
         >>> features_copy('c:/my.gdb/world_counties', 'c:/my.gdb/euro_countries', 'c:/my.gdb', where_clause='country="EU"',
@@ -2102,23 +2622,64 @@ def features_copy(source: str, dest: str, workspace: str, where_clause: str = '*
     kws = {k: None for k in kwargs.keys()}
     if copy_shape:
         kws['SHAPE@'] = None
+
+    # Resolve the invariants once, so the row loop has no per-row branching.
+    # Order matters, kwargs override any duplication with fixed_values
+    fixed_items = list(fixed_values.items()) if fixed_values else []
+    mappings = list(kwargs.items())
+    if copy_shape:
+        mappings.append(('SHAPE@', 'SHAPE@'))
+
     i = 0
+    # With no transaction there is nothing to roll back, so the ORM adds nothing over a plain InsertCursor fed straight from the SearchCursor,
+    # provided every row is an insert. That holds for force_add, or when fail_on_exists turns any match into an error.
+    # For the latter, the existing dest records are read once into a set, rather than the ORM querying dest for every row.
+    if not enable_transactions and (force_add or fail_on_exists):
+        src_cols = [src_key for _, src_key in mappings]
+        dest_cols = [dest_key for dest_key, _ in mappings]
+        fixed_items = [(k, v) for k, v in fixed_items if k not in kwargs]  # kwargs override fixed_values
+        dest_cols += [k for k, _ in fixed_items]
+        fixed_tpl = tuple(v for _, v in fixed_items)  # built once, not per row
+
+        existing = None
+        if not force_add:
+            # a record "exists" if all written fields, bar the shape, match
+            key_ix = [j for j, c in enumerate(dest_cols) if c != 'SHAPE@']
+            with _arcpy.da.SearchCursor(dest, [dest_cols[j] for j in key_ix]) as DC:
+                existing = {tuple(r) for r in DC}
+
+        def _insert(IC, rows) -> int:
+            j = 0
+            for row in rows:
+                new_row = row + fixed_tpl  # SearchCursor rows are tuples
+                if existing is not None:
+                    k = tuple(new_row[x] for x in key_ix)  # noqa
+                    if k in existing:
+                        raise _errors.UpsertExpectedInsertButHadMatchedRow(_errors.UpsertExpectedInsertButHadMatchedRow.__doc__)
+                    existing.add(k)
+                IC.insertRow(new_row)
+                j += 1
+                if not no_progress:
+                    PP.increment()  # noqa
+            return j
+
+        with _arcpy.da.InsertCursor(dest, dest_cols) as IC:
+            if src_cols:
+                with _arcpy.da.SearchCursor(source, src_cols, where_clause=where_clause) as SC:
+                    i = _insert(IC, SC)
+            else:
+                i = _insert(IC, (() for _ in range(n)))
+        return i
+
     with _orm.ORM(dest, workspace=workspace, enable_transactions=enable_transactions, enable_log=False, **kws) as Dest:
         with _crud.SearchCursor(source, field_names=list(kwargs.values()), load_shape=copy_shape, where_clause=where_clause) as Cur:
             for row in Cur:
+                for dest_key, v in fixed_items:
+                    Dest[dest_key] = v
 
-                # write fixed_values kwargs first
-                if fixed_values:
-                    for dest_key, v in fixed_values.items():
-                        Dest[dest_key] = v
-
-                # write passed **kwargs, overriding any duplication with fixed_values
-                if kwargs:
-                    for dest_key, src_key in kwargs.items():
-                        Dest[dest_key] = row[src_key]
+                for dest_key, src_key in mappings:
+                    Dest[dest_key] = row[src_key]
 
-                if copy_shape:
-                    Dest['SHAPE@'] = row['SHAPE@']
                 Dest.add(tran_commit=False, force_add=force_add, fail_on_exists=fail_on_exists)
                 i += 1
                 if not no_progress:
@@ -2182,8 +2743,8 @@ def features_copy2(source: str, dest: str, where_clause: str = '*', fixed_values
 
     if validate_cols:
         if show_progress: print('\nValidating fields ...')
-        dest_cols_db = list(map(str.lower, _struct.fc_fields_get(dest)))
-        src_cols_db = list(map(str.lower, _struct.fc_fields_get(source)))
+        dest_cols_db = set(map(str.lower, _struct.fc_fields_get(dest)))
+        src_cols_db = set(map(str.lower, _struct.fc_fields_get(source)))
 
         dest_cols_write = []
         dest_cols_write += list(map(str.lower, fixed_values.keys()))
@@ -2191,8 +2752,8 @@ def features_copy2(source: str, dest: str, where_clause: str = '*', fixed_values
 
         src_cols_read = list(map(str.lower, kwargs.values()))
 
-        dest_bad = _baselib.list_not(dest_cols_write, dest_cols_db)
-        src_bad = _baselib.list_not(src_cols_read, src_cols_db)
+        dest_bad = [c for c in dest_cols_write if c not in dest_cols_db]
+        src_bad = [c for c in src_cols_read if c not in src_cols_db]
 
         if dest_bad or src_bad:
             raise _errors.FieldNotFound('Field validation failed.\nFields not in source:%s\nFields not in dest:%s' % (src_bad, dest_bad))
@@ -2222,25 +2783,23 @@ def features_copy2(source: str, dest: str, where_clause: str = '*', fixed_values
         src_cols += list(kwargs.values())
         dest_cols += list(kwargs.keys())
     if copy_shape:
-        src_cols += ['SHAPE@']
-        dest_cols += ['SHAPE@']
+        src_cols.append('SHAPE@')
+        dest_cols.append('SHAPE@')
     if fixed_values:
-        dest_cols += list(fixed_values.keys())
+        dest_cols.extend(fixed_values.keys())
 
     insert_rows = []
+    fixed_tpl = tuple(fixed_values.values()) if fixed_values else ()  # built once, not per row
 
     # for efficiency, build all the rows before running the insert
     if src_cols:
         with _arcpy.da.SearchCursor(source, src_cols, where_clause=where_clause) as SCur:
             for row in SCur:
-                row = list(row)
-                if fixed_values:
-                    row += list(fixed_values.values())
-                insert_rows += [row]
+                insert_rows.append(row + fixed_tpl)  # SearchCursor rows are tuples
                 if show_progress: PP.increment()  # noqa
     else:  # we only get here if no kwargs AND we havent asked to copy the geometry (copy_shape is False)
         for x in range(n):
-            insert_rows += [list(fixed_values.values())]
+            insert_rows.append(fixed_tpl)
             if show_progress: PP.increment()  # noqa
 
     i = 0
@@ -2421,39 +2980,40 @@ class Spatial(_MixinNameSpace):  # noqa
         dest = _path.normpath(dest)
         out = False
         try:
-            lyr_union = r"in_memory/%s" % _stringslib.rndstr(from_=_string.ascii_lowercase)
+            lyr_union = r"memory/%s" % _stringslib.rndstr(from_=_string.ascii_lowercase)
             if show_progress: print('\nRunning the union ...')
             _arcpy.analysis.Union([source], lyr_union, "ALL", None, "GAPS")  # noqa
             oidfld = _struct.field_oid(lyr_union)
-            df_union = table_as_pandas2(lyr_union)
 
-            # IN_FID is the df_union objectid
+            # IN_FID is the lyr_union objectid
             if show_progress: print('\nIdentifying identical polygons ...')
             Res = ResultAsPandas(_arcpy.management.FindIdentical, lyr_union, as_int=['OBJECTID', 'IN_FID', 'FEAT_SEQ'], output_record_option='ONLY_DUPLICATES', fields=['Shape'])
 
-            last_feat_seq = None
-            dup_dict = {}
             if not rank_cols: rank_cols = [oidfld]
-            if show_progress and len(Res.df_lower) > 0: PP = _iolib.PrintProgress(maximum=len(Res.df_lower), init_msg='Deleting duplicate rows in in-memory union layer...')
-            row = None
-            for row in Res.df_lower.itertuples(index=False):
-                # dup dict will look like for example (3 rank cols)...
-                # {1:[10, 23, 'uraquay'], 2:[2, 5, 'chile'], ...}
-                if not last_feat_seq:
-                    last_feat_seq = row.feat_seq  # noqa
-                    dup_dict[row.in_fid] = list(  # noqa
-                        df_union.query('%s==%s' % (oidfld, row.in_fid))[rank_cols].iloc[0])  # noqa  Get first (and only) row of the dataframe as a list and put in dictionary with key row.in_fid
-                elif row.feat_seq == last_feat_seq:  # noqa
-                    dup_dict[row.in_fid] = list(df_union.query('%s==%s' % (oidfld, row.in_fid))[rank_cols].iloc[0])  # noqa
-                else:
-                    last_feat_seq, dup_dict = Spatial._del_dups(lyr_union, df_union, dup_dict, row, rank_func, reverse, rank_cols, oidfld)  # noqa
-                    out = True
-                if show_progress: PP.increment()  # noqa
 
-            # Delete last duplicate set - if debugging remember this ** ONLY CONTAINS THE LAST DUPLICATE TO DELETE **
-            if dup_dict and row:  # noqa
-                Spatial._del_dups(lyr_union, df_union, dup_dict, row, rank_func, reverse, rank_cols, oidfld)  # noqa
+            # Index the rank values on oid once, lookups are then plain dict hits.
+            # Only the oid and rank cols are read, no need to pull the whole union layer into pandas
+            with _arcpy.da.SearchCursor(lyr_union, [oidfld] + list(rank_cols)) as Cur:
+                rank_map = {r[0]: r[1:] for r in Cur}
+
+            # Group the duplicates into sets of identical polygons (feat_seq)
+            # each set will look like for example (3 rank cols)...
+            # {1:[10, 23, 'uraquay'], 2:[2, 5, 'chile'], ...}
+            grps = {}
+            for in_fid, feat_seq in zip(Res.df_lower['in_fid'].tolist(), Res.df_lower['feat_seq'].tolist()):
+                grps.setdefault(feat_seq, {})[in_fid] = list(rank_map[in_fid])
+
+            if show_progress and grps: PP = _iolib.PrintProgress(maximum=len(grps), init_msg='Identifying duplicate rows in in-memory union layer...')
+            del_ids = []
+            for dup_dict in grps.values():
+                del_ids.extend(Spatial._del_dups(dup_dict, rank_func, reverse))  # noqa
                 out = True
+                if show_progress: PP.increment()  # noqa
+
+            # Delete all the duplicates together
+            if del_ids:
+                if show_progress: print('\nDeleting %s duplicate rows in in-memory union layer...' % len(del_ids))
+                Spatial._delete_by_ids_bulk(lyr_union, oidfld, del_ids)
 
             # sanity check - did we get rid of all dups
             # RChk = arcdata.ResultAsPandas(arcpy.management.FindIdentical, lyr_union, as_int=['OBJECTID', 'IN_FID', 'FEAT_SEQ'], output_record_option='ONLY_DUPLICATES', fields=['Shape'])
@@ -2462,7 +3022,7 @@ class Spatial(_MixinNameSpace):  # noqa
             _arcpy.env.overwriteOutput = overwrite
             if dissolve_cols:
                 if show_progress: print('\nRunning the dissolve ...')
-                lyr_diss = r'in_memory/%s' % _stringslib.rndstr(from_=_string.ascii_lowercase)
+                lyr_diss = r'memory/%s' % _stringslib.rndstr(from_=_string.ascii_lowercase)
                 if show_progress: print('\nDissolving to in-memory layer ...')
                 _arcpy.management.Dissolve(lyr_union, lyr_diss, dissolve_cols, multi_part=multi_part)
                 if show_progress: print('\nExporting features to %s ...' % dest)
@@ -2477,17 +3037,68 @@ class Spatial(_MixinNameSpace):  # noqa
         return out
 
     @staticmethod
-    def _del_dups(lyr_union, df_union, dup_dict: dict, row, rank_func, reverse, rank_cols, oidfld) -> (int, dict):
-        del_ids = []
-        for i, itm in enumerate(dict(sorted(dup_dict.items(), key=rank_func, reverse=reverse)).items()):
-            if i != 0: del_ids += [itm[0]]  # only add to delids after 1st sorted dict item. i.e. we are retaining the first ordered record and deleting the rest
+    def _delete_by_ids_bulk(fname: str, oidfld: str, ids: list[int], max_in: int = 1000) -> None:
+        """
+        Delete rows in fname by their oid.
 
-        if del_ids:
-            n = 1
-            while n > 0:  # weird behaviour when calling deletew against in-memory layer (see above) - want to make sure
-                n = _crud.CRUD(lyr_union, enable_transactions=False).deletew(_sql.query_where_in(_struct.field_oid(lyr_union), del_ids))
+        Small id lists are deleted with an UpdateCursor over an IN where clause. Larger lists are loaded into an in-memory
+        table, which is joined to fname, so we avoid building and parsing huge IN clauses.
+        If the joined selection does not match the ids exactly, the rows are deleted in batches of range and IN where clauses instead.
+
+        Args:
+            fname (str): feature class or table
+            oidfld (str): name of the oid field in fname
+            ids (list[int]): oids of the rows to delete
+            max_in (int): use an IN where clause up to this many ids
+
+        Returns:
+            None
+        """
+        if not ids: return
+        if len(ids) <= max_in:
+            with _arcpy.da.UpdateCursor(fname, [oidfld], where_clause=_sql.query_where_in(oidfld, ids)) as UC:
+                for _ in UC:
+                    UC.deleteRow()
+            return
+
+        tbl_ids = r'memory\ids_%s' % _stringslib.rndstr(from_=_string.ascii_lowercase)
+        vw = _stringslib.rndstr(from_=_string.ascii_lowercase)
+        try:
+            _struct.CreateTable(*_path.split(tbl_ids))
+            _struct.AddField(tbl_ids, 'del_id', 'LONG')
+            with _arcpy.da.InsertCursor(tbl_ids, ['del_id']) as InsCur:
+                for i in ids:
+                    InsCur.insertRow((i,))
+
+            # Select through a KEEP_COMMON join, the selection survives the join being removed
+            _arcpy.management.MakeTableView(fname, vw)
+            _arcpy.management.AddJoin(vw, oidfld, tbl_ids, 'del_id', 'KEEP_COMMON')
+            _arcpy.management.SelectLayerByAttribute(vw, 'NEW_SELECTION')
+            _arcpy.management.RemoveJoin(vw)
+
+            # DeleteRows on a view with no selection deletes every row, so only use it if the selection is exactly the ids.
+            # Otherwise (join matched nothing, selection lost with the join) delete in batches of range/IN clauses.
+            fids = _arcpy.Describe(vw).FIDSet
+            if fids and len(fids.split(';')) == len(set(ids)):
+                _arcpy.management.DeleteRows(vw)
+            else:
+                for w in _sql.query_where_in_ranges(oidfld, ids, max_in_batch=max_in):
+                    with _arcpy.da.UpdateCursor(fname, [oidfld], where_clause=w) as UC:
+                        for _ in UC:
+                            UC.deleteRow()
+        finally:
+            with _fuckit:
+                _struct.Delete(vw)
+            with _fuckit:
+                _struct.Delete(tbl_ids)
 
-        return row.feat_seq, {row.in_fid: list(df_union.query('%s==%s' % (oidfld, row.in_fid))[rank_cols].iloc[0])}
+    @staticmethod
+    def _del_dups(dup_dict: dict, rank_func, reverse) -> list[int]:
+        """Get the ids in a set of duplicates to delete, i.e. all but the top ranked"""
+        items = list(dup_dict.items())
+        # Only need the one we are retaining, no need to sort. min/max return the first on ties, matching a stable sort
+        keeper = (max if reverse else min)(items, key=rank_func)
+        return [k for k, _ in items if k != keeper[0]]
 
     @staticmethod
     @_decs.environ_persist
@@ -2547,7 +3158,7 @@ class Spatial(_MixinNameSpace):  # noqa
         # Lets do this in memory for speed
         lyrtmp = 'in_memory\%s' % _stringslib.get_random_string(
             from_=_string.ascii_lowercase)  # need to use this as supports alterfield and several other features that memory workspace doesnt support
-        fid_cols = ['FID_%s' % s for s in [_iolib.get_file_parts2(t)[1] for t in srcs]]
+        fid_cols = ['FID_%s' % _iolib.get_file_parts2(t)[1] for t in srcs]
         if show_progress: print('\nPerforming initial Union ....')
         try:
             _arcpy.analysis.Union(srcs, lyrtmp, **kwargs)  # noqa
@@ -2562,16 +3173,27 @@ class Spatial(_MixinNameSpace):  # noqa
                     print('Adding is_ cols ...')
                     PP = _iolib.PrintProgress(fid_cols)
 
+                allflds_lower = {f.lower() for f in allflds}
+                is_fields_lower = set() if is_fields == 'ALL' else {f.lower() for f in ([is_fields] if isinstance(is_fields, str) else is_fields)}
+                todo = []  # (fidcol, isfld)
                 for fidcol in fid_cols:
-                    if fidcol.lower() in map(str.lower, allflds):
+                    fidcol_lower = fidcol.lower()
+                    if fidcol_lower in allflds_lower:
                         isfld = 'is_%s' % fidcol[4:]
-                        if is_fields == 'ALL' or fidcol.lower() in map(str.lower, is_fields):
-                            _struct.AddField(lyrtmp, isfld, 'SHORT')
-                            field_apply_func(lyrtmp, fidcol, isfld, Funcs.LongToOneZero, show_progress=show_progress)
+                        if is_fields == 'ALL' or fidcol_lower in is_fields_lower:
+                            todo.append((fidcol, isfld))
                             out['good'] = isfld  # this is a DictList, we dont need +=
                     else:
                         out['bad'] = fidcol  # this is a DictList, we dont need +=
                     if show_progress: PP.increment()  # noqa
+
+                # Add all the is_ cols in one schema change, then populate them in a single pass
+                if todo:
+                    _struct.AddFields(lyrtmp, [[isfld, 'SHORT'] for _, isfld in todo])
+                    n = len(todo)
+                    with _arcpy.da.UpdateCursor(lyrtmp, [f for f, _ in todo] + [f for _, f in todo]) as UC:
+                        for row in UC:
+                            UC.updateRow(row[:n] + [Funcs.LongToOneZero(v) for v in row[:n]])
             keep_cols_cpy = ['Shape']
             if keep_cols and isinstance(keep_cols, (list, tuple)):
                 if show_progress: print('Deleting fields ...')
@@ -2614,6 +3236,39 @@ class Spatial(_MixinNameSpace):  # noqa
 
         return dict(out)
 
+    @staticmethod
+    def _extent_overlap_candidates(fname: str) -> list[int]:
+        """
+        Get the oids of features whose extents intersect the extent of at least one other feature.
+        Uses a sort and sweep on xmin, so only features that could overlap are passed to the expensive Union.
+
+        Args:
+            fname (str): feature class
+
+        Returns:
+            list[int]: sorted list of candidate oids, empty if no extents intersect
+        """
+        # arcpy.da has no extent token (SHAPE@ is the only token exposing the extent), so the full geometry has to be read.
+        # The extent is fetched once per shape, each .extent access builds a new Extent object.
+        boxes = []
+        with _arcpy.da.SearchCursor(fname, ['OID@', 'SHAPE@']) as Cur:
+            for oid, shp in Cur:
+                if not shp: continue
+                e = shp.extent
+                boxes.append((e.XMin, e.XMax, e.YMin, e.YMax, oid))
+        boxes.sort()
+
+        cands = set()
+        active = []
+        for xmin, xmax, ymin, ymax, oid in boxes:
+            active = [b for b in active if b[1] >= xmin]
+            for b in active:
+                if b[2] <= ymax and ymin <= b[3]:
+                    cands.add(b[4])
+                    cands.add(oid)
+            active.append((xmin, xmax, ymin, ymax, oid))
+        return sorted(cands)
+
     @staticmethod
     def features_overlapping(fname: str, fields: (str, list[str]) = None) -> tuple[bool, (None, list[list[int]])]:
         """
@@ -2649,24 +3304,40 @@ class Spatial(_MixinNameSpace):  # noqa
         if isinstance(fields, str): fields = [fields]
         if fields is None: fields = []
         lyr_union = r"memory\%s" % _stringslib.rndstr(from_=_string.ascii_lowercase)
+        lyr_cands = None
+
+        # broadphase on feature extents, only features with an intersecting extent can overlap
+        cands = Spatial._extent_overlap_candidates(fname)
+        if not cands: return False, None
 
         try:
-            _arcpy.analysis.Union([fname], lyr_union, "ALL", None, "GAPS")  # noqa
-            idcol = 'FID_%s' % _path.basename(fname)
+            src = fname
+            if len(cands) < _common.get_row_count(fname):
+                lyr_cands = _stringslib.rndstr(from_=_string.ascii_lowercase)
+                # cands can be most of the layer, so runs of consecutive oids go in as ranges rather than one unbounded IN list
+                where_cands = ' OR '.join('(%s)' % w for w in _sql.query_where_in_ranges(_struct.field_oid(fname), cands))
+                _arcpy.management.MakeFeatureLayer(fname, lyr_cands, where_clause=where_cands)
+                src = lyr_cands
+
+            _arcpy.analysis.Union([src], lyr_union, "ALL", None, "GAPS")  # noqa
+            idcol = [f for f in _struct.field_list(lyr_union, oid=False, shape=False) if f.upper().startswith('FID_')][0]
             # arcpy.management.FindIdentical("address_crn_lpis_sq_Union", r"S:\SPECIAL-ACL\ERAMMP2 Survey Restricted\common\data\GIS\_arcpro_projects\gmep_surveys\gmep_surveys.gdb\address_crn_lp_FindIdentical", "Shape", None, 0, "ONLY_DUPLICATES")
             Res = ResultAsPandas(_arcpy.management.FindIdentical, lyr_union, as_int=['OBJECTID', 'IN_FID', 'FEAT_SEQ'], output_record_option='ONLY_DUPLICATES', fields=['Shape'] + fields)
             if not len(Res.df) or len(Res.df) == 0: return False, None  # noqa
 
-            df_lyr_union = table_as_pandas2(lyr_union, [_struct.field_oid(lyr_union), idcol])
-            ddf = pandas_join(Res.df_lower, df_lyr_union, 'in_fid', _struct.field_oid(lyr_union))
-            out = []
-            for row in ddf.iterrows():
-                if len(out) < row[1].feat_seq:  # noqa
-                    out.append([])
-                ind = int(row[1].feat_seq - 1)
-                out[ind] += [row[1][idcol]]  # noqa
+            oidfld = _struct.field_oid(lyr_union)
+            with _arcpy.da.SearchCursor(lyr_union, [oidfld, idcol]) as Cur:
+                id_map = {r[0]: r[1] for r in Cur}
+
+            grps = {}
+            for in_fid, feat_seq in zip(Res.df_lower['in_fid'].tolist(), Res.df_lower['feat_seq'].tolist()):
+                grps.setdefault(feat_seq, []).append(id_map[in_fid])
+            out = [grps[k] for k in sorted(grps)]
         finally:
             _struct.fc_delete2(lyr_union)
+            if lyr_cands:
+                with _fuckit:
+                    _struct.Delete(lyr_cands)
         return True, out  # noqa
 
     @staticmethod
@@ -2734,7 +3405,7 @@ class Spatial(_MixinNameSpace):  # noqa
         if not dest and not export_target_features:
             raise UserWarning('dest and export_target_features both evaluated to False. Set both, or one or the other')
 
-        _arcpy.env.workspace = _common.gdb_from_fname('in_memory')
+        _arcpy.env.workspace = _common.gdb_from_fname('memory')
 
         # add the ratio fld and calc
         if _struct.field_exists(source, 'thinness'):
@@ -2746,13 +3417,20 @@ class Spatial(_MixinNameSpace):  # noqa
             if source.lower() == _path.normpath(dest).lower() and not overwrite:
                 raise ValueError('source and dest were the same and overwrite was False')
 
-            fname_mem = 'in_memory/%s' % _stringslib.get_random_string(from_=_string.ascii_lowercase)
+            fname_mem = 'memory/%s' % _stringslib.get_random_string(from_=_string.ascii_lowercase)
             if show_progress: print('\nExploding %s to %s ...' % (source, fname_mem))
             _arcpy.management.MultipartToSinglepart(source, fname_mem)  # necessary for the Eliminate tool, plus also stick it in_memory
             # But - in_memory layer - length and area fields will be borked - we recalulate them in the while loop
 
+            # length and area fields are recreated here, they are carried through the Eliminate outputs and refreshed in the loop
+            for fld in (shape_length_field, shape_area_fld):
+                _struct.DeleteField(fname_mem, fld)
+                _struct.AddField(fname_mem, fld, 'FLOAT')
             _struct.AddField(fname_mem, 'thinness', 'DOUBLE')
             fname_mem_oid = _struct.field_oid(fname_mem)
+            # loop invariant where clauses
+            where_null = '%s OR %s' % (_sql.is_null(shape_length_field), _sql.is_null(shape_area_fld))
+            where = _get_where(shape_area_fld, area_thresh, thinness_thresh, where_clause)
 
             if show_progress: print('\nSelecting sliver polygons ...')
 
@@ -2770,21 +3448,24 @@ class Spatial(_MixinNameSpace):  # noqa
                     print('\nIterations exceeded %s. This is unexpected. Breaking out of loop. Check results.' % max_iterations)
                     break
 
-                # we need to recalculate our thinness because we are using an in-memory layer
-                shape_length_add(fname_mem, shape_length_field, overwrite=True, show_progress=show_progress)
-                shape_area_add(fname_mem, shape_area_fld, overwrite=True, show_progress=show_progress)
+                # we need to recalculate length, area and thinness because we are using an in-memory layer.
+                # Read them with the SHAPE@ tokens first, so the UpdateCursor has no shape field and does not write every geometry back.
+                if show_progress: print('\nCalculating length, area and thinness ...')
+                with _arcpy.da.SearchCursor(fname_mem, ['OID@', 'SHAPE@LENGTH', 'SHAPE@AREA']) as SC:
+                    len_area = {oid: (sl, sa) for oid, sl, sa in SC}
+                with _arcpy.da.UpdateCursor(fname_mem, ['OID@', shape_length_field, shape_area_fld, 'thinness']) as UC:
+                    for row in UC:
+                        sl, sa = len_area.get(row[0], (None, None))
+                        UC.updateRow([row[0], sl, sa, Funcs.ThinnessRatioValues(sa, sl)])
 
                 if show_progress: print('\nRemoving rows with null length or area ...')
-                _crud.CRUD(fname_mem, enable_transactions=False).deletew(
-                    '%s OR %s' % (_sql.is_null(shape_length_field), _sql.is_null(shape_area_fld)))  # shouldnt me needed, but results of previous eliminates can generate null shapes
-                field_apply_func(fname_mem, [shape_area_fld, shape_length_field], 'thinness', Funcs.ThinnessRatioValues, show_progress=show_progress)
+                _crud.CRUD(fname_mem, enable_transactions=False).deletew(where_null)  # shouldnt me needed, but results of previous eliminates can generate null shapes
 
                 _arcpy.management.MakeFeatureLayer(fname_mem, 'lyrmem')
 
                 # This is a bit of a kludge, but the idea is to decrease the number of selected features
                 # to merge up some smaller slivers with other slivers that now do not match the selection criteria (but are still slivers by the original passed criteria)
                 # the stuck_factor selects for increasingly smaller slivers, but we will eventually exit according to max_iterations
-                where = _get_where(shape_area_fld, area_thresh, thinness_thresh, where_clause)
                 where_stuck = ''
                 if len(counts) > 1 and counts[-1] / counts[-2] > 0.8 and not stuck:
                     stuck = True
@@ -2795,22 +3476,29 @@ class Spatial(_MixinNameSpace):  # noqa
                     stuck = False
                     stuck_factor = 2
 
-                _arcpy.management.SelectLayerByAttribute('lyrmem', 'NEW_SELECTION', where_clause=where)
-                counts += [int(_arcpy.management.GetCount('lyrmem')[0])]  # yes, getcount[0] is a fickin string
+                # derived output 1 of SelectLayerByAttribute is the selection count (0 is the layer), saves a GetCount call. Yes, it's a string.
+                counts += [int(_arcpy.management.SelectLayerByAttribute('lyrmem', 'NEW_SELECTION', where_clause=where).getOutput(1))]
                 if stuck:
                     if stuck_factor > 5:
                         # lets try something else, pick a random 50% subsample of the slivers to seed merges around
                         if show_progress: print('\nStuck ... using random strategy to unstick ...')
                         stuck_factor = 2
-                        oids = [row[0] for row in _arcpy.da.SearchCursor('lyrmem', [fname_mem_oid])]
-                        oidsrnd = _baselib.list_random_pick(oids, max(int(counts[-1] / 2), 0))
+                        # reservoir sample (algorithm R), so we hold the picked oids only, not the whole selection
+                        k = max(int(counts[-1] / 2), 0)
+                        oidsrnd = []
+                        with _arcpy.da.SearchCursor('lyrmem', [fname_mem_oid]) as Cur:
+                            for i, row in enumerate(Cur):
+                                if i < k:
+                                    oidsrnd.append(row[0])
+                                else:
+                                    j = _random.randint(0, i)
+                                    if j < k: oidsrnd[j] = row[0]
                         if not oidsrnd:
                             if show_progress: print('\nRandom slivers could not be picked. Failed to unstick. Exiting loop ...')
                             break
 
-                        where_rand = '(%s) AND (%s)' % (_sql.query_where_in(fname_mem_oid, oidsrnd), _get_where(shape_area_fld, area_thresh, thinness_thresh, where_clause))
-                        _arcpy.management.SelectLayerByAttribute('lyrmem', 'NEW_SELECTION', where_clause=where_rand)
-                        z = int(_arcpy.management.GetCount('lyrmem')[0])
+                        where_rand = '(%s) AND (%s)' % (_sql.query_where_in(fname_mem_oid, oidsrnd), where)
+                        z = int(_arcpy.management.SelectLayerByAttribute('lyrmem', 'NEW_SELECTION', where_clause=where_rand).getOutput(1))
                         if z == 0 and show_progress:
                             print('\nRandom slivers could not be selected. This is unexpected. *** Debug required ***. Exiting loop ...')
                             break
@@ -2846,7 +3534,7 @@ class Spatial(_MixinNameSpace):  # noqa
                     if not dest: return 0
 
                 if show_progress: print('\nExecuting Eliminate tool ... Counts: %s; stuck: %s; stuck_factor: %s' % (counts, stuck, stuck_factor))
-                eliminated_mem = 'in_memory/%s' % _stringslib.get_random_string(from_=_string.ascii_lowercase)
+                eliminated_mem = 'memory/%s' % _stringslib.get_random_string(from_=_string.ascii_lowercase)
                 _arcpy.management.Eliminate('lyrmem', eliminated_mem, **kwargs)
                 _struct.Delete(fname_mem)  # lets not run out of memory
                 _struct.Delete('lyrmem')
@@ -2865,10 +3553,10 @@ class Spatial(_MixinNameSpace):  # noqa
                 _struct.Delete('lyrmem')  # noqa
 
         if len(counts) == 1: return counts[0]
-        return sum(_more_itertools.difference(counts, func=lambda x, y: (x - y) * -1, initial=1))
+        return counts[0] - counts[-1]  # the sum of successive differences in counts telescopes to this
 
     @staticmethod
-    def intersect_not(in_feature: str, in_feature1: str, **kwargs) -> list[int]:
+    def intersect_not(in_feature: str, in_feature1: str, all_oids: (list[int], _np.ndarray, None) = None, **kwargs) -> list[int]:
         """
         Check if any features in in_feature DO NOT intersect with in_feature1.
 
@@ -2878,37 +3566,55 @@ class Spatial(_MixinNameSpace):  # noqa
             in_feature: first feature
             in_feature1: other feature
 
-            **kwargs:
-                keyword arguments passed to arcpy.analysis.Intersect
-                See https://pro.arcgis.com/en/pro-app/latest/tool-reference/analysis/intersect.htm
+            all_oids:
+                All oids in in_feature, if already known. Saves reading them again when checking one layer against several others.
+                None reads them from in_feature.
 
-        Raises:
-            TypeError: If the ResultsAsPandas output ResultsAsPandas.df was not an isntance of pandas.DataFrame. This is an unexpected result would require further investigation.
+            **kwargs:
+                keyword arguments passed to arcpy.management.SelectLayerByLocation, e.g. search_distance
+                See https://pro.arcgis.com/en/pro-app/latest/tool-reference/data-management/select-layer-by-location.htm
 
         Returns:
-            List of OIDs for the features that DO NOT intersect with in_feature
+            List of OIDs for the features that DO NOT intersect with in_feature, ascending as a side effect of numpy.setdiff1d
             Returns an empty list, if all features intersected
 
         Notes:
-            This uses the standard intersect, if performance is an issue, then
-            a new function could be created using the pairwise intersect
-            But pairwise intersect is not available under the standard license
+            Uses a select by location rather than an intersect, so no intersect feature class is written, we only need the oids.
+            As with analysis.Intersect, polygons must share some area with a polygon in_feature1 to intersect, those only touching along an edge or at a vertex do not.
+            If kwargs are passed (e.g. search_distance), the select by location result is used as is.
         """
         in_feature = _path.normpath(in_feature)
         in_feature1 = _path.normpath(in_feature1)
+        lyr = _stringslib.rndstr(from_=_string.ascii_lowercase)
 
-        RAP = ResultAsPandas(_arcpy.analysis.Intersect,
-                             in_features=[in_feature, in_feature1],
-                             join_attributes='ONLY_FID', **kwargs)
-
-        if isinstance(RAP.df, _pd.DataFrame):
-            if len(RAP.df) == 0: return field_values(in_feature, _common.oid_field(in_feature))  # i.e. no intersects, so all in_features DO NOT intersect in_feature1
-        else:
-            raise TypeError('ResultsAsPandas had an empty results dataframe. This is unexpected')
-        in_feat_oids = field_values(in_feature, _common.oid_field(in_feature))
-        fid_col = 'fid_%s' % _path.basename(in_feature).lower()
-        in_feat_intersect_oids = list(map(int, RAP.df_lower[fid_col].to_list()))
-        return sorted(_baselib.list_not(in_feat_oids, in_feat_intersect_oids))
+        try:
+            _arcpy.management.MakeFeatureLayer(in_feature, lyr)
+            if all_oids is None:
+                with _arcpy.da.SearchCursor(lyr, ['OID@']) as Cur:
+                    all_oids = _np.fromiter((r[0] for r in Cur), dtype=_np.int64)
+            else:
+                all_oids = _np.asarray(all_oids, dtype=_np.int64)
+
+            _arcpy.management.SelectLayerByLocation(lyr, 'INTERSECT', in_feature1, selection_type='NEW_SELECTION', **kwargs)
+            with _arcpy.da.SearchCursor(lyr, ['OID@']) as Cur:  # honours the selection
+                hit_oids = _np.fromiter((r[0] for r in Cur), dtype=_np.int64)
+
+            # INTERSECT also selects polygons which only touch in_feature1 along an edge or at a vertex. They share no area,
+            # so analysis.Intersect gave no output for them and they were reported as not intersecting, keep that meaning.
+            # Only polygons touching a boundary can be touch only, so just those get a geometry test.
+            if not kwargs and len(hit_oids) and Describe(in_feature)['shapeType'] == 'Polygon' and Describe(in_feature1)['shapeType'] == 'Polygon':
+                _arcpy.management.SelectLayerByLocation(lyr, 'BOUNDARY_TOUCHES', in_feature1, selection_type='SUBSET_SELECTION')
+                with _arcpy.da.SearchCursor(lyr, ['OID@', 'SHAPE@']) as Cur:
+                    touching = [(oid, shp) for oid, shp in Cur if shp]
+                if touching:
+                    with _arcpy.da.SearchCursor(in_feature1, ['SHAPE@'], spatial_reference=Describe(in_feature)['spatialReference']) as Cur:
+                        others = [r[0] for r in Cur if r[0]]
+                    touch_only = [oid for oid, shp in touching if not any(not shp.disjoint(g) and not shp.touches(g) for g in others)]
+                    hit_oids = _np.setdiff1d(hit_oids, _np.asarray(touch_only, dtype=_np.int64), assume_unique=True)
+        finally:
+            with _fuckit:
+                _struct.Delete(lyr)
+        return _np.setdiff1d(all_oids, hit_oids, assume_unique=True).tolist()
 
 
 class Validation:
@@ -2945,10 +3651,17 @@ class Validation:
             Check referential integrity between a "primary key"  and related "foreign key" table
 
 
+    Args:
+        parent (str): The feature class or table to validate
+        no_shapes (bool): Exclude the Shape column when loading df
+        columns (str, list[str], None): Only load these columns into df, reducing load time and memory for wide tables. None loads all columns (subject to no_shapes).
+
     Fields:
         fname: The original feature class name
         gdb: The geodatabase
 
+        oids: All oids in fname, read on first use
+
         gx_df:
             An instance of self.df, exposed as a great expectations data instance.
             See the great-expectations documentation for list of expectations.
@@ -3020,7 +3733,7 @@ class Validation:
 
         return out
 
-    def __init__(self, parent: str, no_shapes: bool = False):
+    def __init__(self, parent: str, no_shapes: bool = False, columns: (str, list[str], None) = None):
         self.fname = _path.normpath(parent)
         self.gdb = _common.gdb_from_fname(self.fname)
         self.fname_base = _path.basename(self.fname)
@@ -3031,8 +3744,19 @@ class Validation:
             raise _errors.FeatureClassOrTableNotFound('Parent feature class or table "%s" not found.' % self.fname)
 
         exclude_cols = ('Shape',) if no_shapes else tuple()
-        self.df: _pd.DataFrame = table_as_pandas2(self.fname, exclude_cols=exclude_cols, cols_lower=True)
-        self.gx_df: _gx.dataset.PandasDataset = _gx.from_pandas(self.df)  # noqa
+        self.df: _pd.DataFrame = table_as_pandas2(self.fname, cols=columns, exclude_cols=exclude_cols, cols_lower=True)
+
+    @_functools.cached_property
+    def gx_df(self) -> 'great_expectations.dataset.PandasDataset':  # noqa
+        """self.df as a great expectations dataset. Built on first access only, most checks do not need it."""
+        import great_expectations as _gx  # slow import, so only done if gx_df is used
+        return _gx.from_pandas(self.df)  # noqa
+
+    @_functools.cached_property
+    def oids(self) -> _np.ndarray:
+        """All oids in self.fname. Read on first access and reused by checks such as intersects_all."""
+        with _arcpy.da.SearchCursor(self.fname, ['OID@']) as Cur:
+            return _np.fromiter((r[0] for r in Cur), dtype=_np.int64)
 
     def stats(self, to_excel: str = None, to_table: bool = False) -> _pd.DataFrame:
         """
@@ -3082,7 +3806,7 @@ class Validation:
         return df
 
     def near(self, is_near_fnames: (str, list[str]), threshhold: (float, int), is_near_filters: (str, list[str], None) = None, keep_cols: (tuple[str], None) = None, thresh_error_test='>',
-             raise_exception: bool = False, **kwargs) -> tuple[bool, (_pd.DataFrame, None)]:
+             raise_exception: bool = False, backend: str = 'arcpy', **kwargs) -> tuple[bool, (_pd.DataFrame, None)]:
         """
         Check if shapes are within "threshold" of any shapes in "is_near_frames".
 
@@ -3119,6 +3843,12 @@ class Validation:
                 If True, will raise an exception if any records above threshhold are found.
                 This is useful for processing pipelines, where we want execution to halt if anything is suspect.
 
+            backend:
+                'arcpy' uses arcpy.analysis.Near.
+                'shapely' loads the geometries into shapely (>=2.0) and uses an STRtree nearest query, this avoids the geoprocessing overhead and is much faster for points and simple shapes.
+                The shapely backend is planar only, distances and search_radius are in the map units of the layers, which must share a projected coordinate system.
+                Only a numeric search_radius is supported from kwargs.
+
             kwargs:
                 Keyword arguments passed to arcpy.analysis.Near.
                 Supports search_radius, location, angle, method, field_names, distance_unit
@@ -3126,6 +3856,9 @@ class Validation:
 
         Raises:
             UserWarning: If raise_exception is True and suspect records (above threshhold distance) are found and "raise_exception" is True
+            ValueError: If thresh_error_test is not one of '>', '>=', '<', '<=', '==', '!='
+            ValueError: If backend is not 'arcpy' or 'shapely'
+            ValueError: If backend is 'shapely' and kwargs other than search_radius are passed, or search_radius is not a number (e.g. "100 Meters")
 
 
         Returns:
@@ -3159,15 +3892,25 @@ class Validation:
             ...
         """
         fname = self.fname
+        if backend == 'shapely':
+            # Fail early rather than silently ignoring Near options the shapely backend cannot honour
+            unsupported = [k for k in kwargs if k != 'search_radius']
+            if unsupported:
+                raise ValueError('backend "shapely" does not support kwargs %s. Use backend "arcpy".' % unsupported)
+            sr = kwargs.get('search_radius')
+            if sr is not None and (isinstance(sr, bool) or not isinstance(sr, (int, float))):
+                raise ValueError('backend "shapely" requires search_radius as a number in map units, got "%s". Use backend "arcpy" for linear unit strings.' % sr)
+
         if not thresh_error_test: thresh_error_test = '>='
         if isinstance(is_near_fnames, str): is_near_fnames = [is_near_fnames]
         is_near_fnames = [_path.normpath(s) for s in is_near_fnames]
 
-        keep = ['OID']
-        keep += ['NEAR_FID', 'NEAR_DIST']
-        keep += keep_cols if isinstance(keep_cols, (list, tuple)) else []
-        keep = list(set(keep))
-        keep = list(map(str.lower, keep))
+        # Only these columns are read from the Near result, OID@ is renamed to oid in the result
+        # Deduplicated case insensitively, dict keeps insertion order so OID@ stays first
+        keep_d = {}
+        for c in ['OID@', 'NEAR_FID', 'NEAR_DIST'] + (list(keep_cols) if isinstance(keep_cols, (list, tuple)) else []):
+            keep_d.setdefault(c.lower(), c)
+        keep = list(keep_d.values())
 
         if isinstance(is_near_filters, str):
             is_near_filters = [is_near_filters]
@@ -3178,22 +3921,33 @@ class Validation:
         is_near_fnames_tmp = []
         try:
             if is_near_filters:
-                # This creates in memory layers filtered for the wheres
+                # This creates feature layers filtered for the wheres. Near accepts layers, so there is no need to copy the features out
                 if len(is_near_filters) != len(is_near_fnames):
                     raise ValueError('len(is_near_filters) != len(is_near_fnames)')
 
-                is_near_fnames_tmp = [memory_lyr_get() for _ in is_near_fnames]
-                for i, lyr in enumerate(is_near_fnames_tmp):
-                    _arcpy.conversion.ExportFeatures(is_near_fnames[i], is_near_fnames_tmp[i], where_clause=is_near_filters[i])
+                for src, where in zip(is_near_fnames, is_near_filters):
+                    lyr = _stringslib.rndstr(from_=_string.ascii_lowercase)
+                    _arcpy.management.MakeFeatureLayer(src, lyr, where_clause=where)
+                    is_near_fnames_tmp.append(lyr)
 
                 kwargs['near_features'] = is_near_fnames_tmp
             else:  # no filters, much easier!
                 kwargs['near_features'] = is_near_fnames
 
-            Nr = ResultAsPandas(_arcpy.analysis.Near, in_features=fname, **kwargs)
-
-            Nr.df_lower: _pd.DataFrame  # noqa for pycharm autocomplete
-            df = Nr.df_lower[keep].query('near_dist %s @threshhold' % thresh_error_test, inplace=False)
+            if backend == 'shapely':
+                df_near = self._near_shapely(kwargs['near_features'], keep, kwargs.get('search_radius'))
+            elif backend == 'arcpy':
+                Nr = ResultAsPandas(_arcpy.analysis.Near, in_features=fname, columns=keep, **kwargs)
+                df_near = Nr.df_lower  # noqa
+            else:
+                raise ValueError('backend must be "arcpy" or "shapely", got "%s"' % backend)
+
+            ops = {'>': _operator.gt, '>=': _operator.ge, '<': _operator.lt, '<=': _operator.le, '==': _operator.eq, '!=': _operator.ne}
+            op = ops.get(thresh_error_test.strip())
+            if op is None:
+                raise ValueError('thresh_error_test "%s" is not supported. Use one of %s' % (thresh_error_test, list(ops.keys())))
+            df = df_near.rename(columns={'oid@': 'oid'})
+            df = df[op(df['near_dist'].to_numpy(), threshhold)]
             if len(df) > 0 and raise_exception:
                 raise UserWarning('Layer "%s" had features outside of threshold distance condition "%s %s" with features in "%s".\n\nOIDs in %s were:\n%s.' % (
                     _path.basename(fname), thresh_error_test, threshhold, is_near_fnames, _path.basename(fname), df['oid'].to_list()))
@@ -3206,6 +3960,48 @@ class Validation:
                 return False, df
         return True, None
 
+    def _near_shapely(self, near_features: list[str], keep: list[str], search_radius: (float, None) = None) -> _pd.DataFrame:
+        """
+        Nearest feature distances from self.fname to near_features, calculated with a shapely STRtree.
+
+        Args:
+            near_features: feature classes or layers with the near feature candidates
+            keep: columns to read from self.fname, must start with ['OID@', 'NEAR_FID', 'NEAR_DIST']
+            search_radius: max distance to search, features with nothing in range get near_fid and near_dist of -1, as arcpy Near does
+
+        Returns:
+            pandas.DataFrame: lower cased columns matching those of the Near result read with "keep"
+        """
+        import shapely  # noqa  optional dependency, only needed for this backend
+
+        attr_cols = keep[3:]
+        with _arcpy.da.SearchCursor(self.fname, ['OID@', 'SHAPE@WKB'] + attr_cols) as Cur:
+            rows = [r for r in Cur]
+        geoms_a = shapely.from_wkb(_np.array([bytes(r[1]) if r[1] else None for r in rows], dtype=object))
+
+        near_oids, wkbs = [], []
+        for fc in near_features:
+            with _arcpy.da.SearchCursor(fc, ['OID@', 'SHAPE@WKB']) as Cur:
+                for oid, wkb in Cur:
+                    if wkb:
+                        near_oids.append(oid)
+                        wkbs.append(bytes(wkb))
+        geoms_b = shapely.from_wkb(_np.array(wkbs, dtype=object))
+        near_oids = _np.array(near_oids, dtype=_np.int64)
+
+        near_fid = _np.full(len(rows), -1, dtype=_np.int64)
+        near_dist = _np.full(len(rows), -1, dtype=_np.float64)
+        if len(geoms_b):
+            tree = shapely.STRtree(geoms_b)
+            idx, dist = tree.query_nearest(geoms_a, max_distance=search_radius, return_distance=True, all_matches=False)
+            near_fid[idx[0]] = near_oids[idx[1]]
+            near_dist[idx[0]] = dist
+
+        df = _pd.DataFrame({'oid@': [r[0] for r in rows], 'near_fid': near_fid, 'near_dist': near_dist})
+        for i, c in enumerate(attr_cols):
+            df[c.lower()] = [r[2 + i] for r in rows]
+        return df
+
     def referential_integrity(self, parent_field, child, child_field, in_parent_only_is_error: bool = False, as_oids=False, raise_exception: bool = False) -> tuple[bool, (dict[str:list], None)]:
         """
         Wrapper around key_info. Exposed here as key_info is primarily a data validation check.
@@ -3243,7 +4039,16 @@ class Validation:
             {'parent_only': ['NoTownCountry',...], 'child_only': ['NoCountryTown',...]}
         """
         parent = self.fname
-        res = key_info(parent, parent_field, child, child_field, as_oids)
+        if as_oids:
+            res = key_info(parent, parent_field, child, child_field, as_oids)
+        else:
+            # Stream the keys straight into sets, we only need the two differences, not the "both" list key_info also builds
+            child = _path.normpath(child)
+            with _arcpy.da.SearchCursor(parent, [parent_field]) as Cur:
+                parent_keys = {r[0] for r in Cur}
+            with _arcpy.da.SearchCursor(child, [child_field]) as Cur:
+                child_keys = {r[0] for r in Cur}
+            res = {'parent_only': list(parent_keys - child_keys), 'child_only': list(child_keys - parent_keys)}
         if raise_exception:
             if res['child_only']:
                 raise UserWarning('Invalid foreign key values "%s" in "%s.%s"' % (res['child_only'], child, child_field))
@@ -3258,9 +4063,21 @@ class Validation:
             out_dict['parent_only'] = res['parent_only']
 
         if out_dict:
-            return False, True
+            return False, out_dict
         return True, None
 
+    @staticmethod
+    def _single_rectangle(fname: str, spatial_reference=None) -> (_arcpy.Polygon, None):
+        """Get the single polygon in fname, projected to spatial_reference, if it is an axis aligned rectangle in that spatial reference, else None"""
+        if Describe(fname)['shapeType'] != 'Polygon' or get_row_count(fname) != 1:
+            return None
+        with _arcpy.da.SearchCursor(fname, ['SHAPE@'], spatial_reference=spatial_reference) as Cur:
+            g = next(Cur)[0]
+        if not g: return None
+        e = g.extent
+        if abs(g.area - e.width * e.height) > 1e-9 * max(g.area, 1): return None
+        return g
+
     def intersects_all(self, in_feature: str, raise_exception: bool = False, **kwargs) -> tuple[bool, (list[int], None)]:
         """
         Check that no features in our layer are fully outside of in_feature.
@@ -3270,17 +4087,20 @@ class Validation:
         Args:
             in_feature: Feature to check against
             raise_exception: Raise a UserWarning if test failed
-            **kwargs: passed to arcpy.analysis.Intersect
+            **kwargs: passed to arcpy.management.SelectLayerByLocation
 
         Raises:
             UserWarning: If raise_exception was True and some shapes did not intersect shapes in "in_feature"
 
         Returns:
             None: If there were no issues, i.e. all features in our layer (self.fname) intersected with at least one feature in fc in_feature
-            list[int]: List of OIDs in self.fname that had no intersect with in_Feature
+            list[int]: List of OIDs in self.fname that had no intersect with in_Feature. The order is not guaranteed, sort it if you need to.
 
         Notes:
             Also see method "near".
+            If in_feature is a single rectangle (e.g. a sample square) and no kwargs are passed, features are classified on their extents,
+            and only those crossing the rectangle's edge are tested against the rectangle geometry, no select by location is run.
+            Polygons which only touch in_feature along an edge or at a vertex do not intersect it, see Spatial.intersect_not.
 
         Examples:
 
@@ -3294,7 +4114,28 @@ class Validation:
             >>> Validation('C:/my.gdb/lpis').intersects_all('C:/my.gdb/sample_squares')
             False, [12, 33, 55]
         """
-        out = Spatial.intersect_not(self.fname, in_feature, **kwargs)
+        in_feature = _path.normpath(in_feature)
+        # The rectangle is read in our layer's spatial reference, so its extent and the shapes below are directly comparable
+        rect_g = None if kwargs else Validation._single_rectangle(in_feature, Describe(self.fname)['spatialReference'])
+        if rect_g is None:
+            out = Spatial.intersect_not(self.fname, in_feature, all_oids=self.oids, **kwargs)
+        else:
+            # in_feature is one rectangle, so features can be classed on their extents alone. Only those crossing
+            # its edge need a geometry test, done here against the rectangle rather than a select over the whole layer.
+            rect = rect_g.extent
+            out = []
+            with _arcpy.da.SearchCursor(self.fname, ['OID@', 'SHAPE@']) as Cur:
+                for oid, shp in Cur:
+                    if not shp:  # null shapes are never selected by an intersect
+                        out.append(oid)
+                        continue
+                    e = shp.extent
+                    if e.XMax < rect.XMin or e.XMin > rect.XMax or e.YMax < rect.YMin or e.YMin > rect.YMax:
+                        out.append(oid)
+                    elif not (e.XMin >= rect.XMin and e.XMax <= rect.XMax and e.YMin >= rect.YMin and e.YMax <= rect.YMax):
+                        # polygons must share area with the rectangle, as in intersect_not, touching its edge is not enough
+                        if shp.disjoint(rect_g) or (shp.type == 'polygon' and shp.touches(rect_g)):
+                            out.append(oid)
         if out and raise_exception:
             raise UserWarning('%s had shapes that did not intersect %s.\n\nOIDs in %s were:\n%s' % (self.fname, in_feature, _path.basename(self.fname), out))
         if not out:
@@ -3382,7 +4223,7 @@ def vertext_add(fname, vertex_index: (int, str), x_field: str, y_field: str = 'y
         x_field ():  Field name for x coordinate
         y_field (str): Field name for y coordinate
         field_type (str): Passed to AddField when creating new fields. 'FLOAT', 'DOUBLE', 'LONG' recommended
-        where_clause (str): Record filter passed to the crud.UpdateCursor
+        where_clause (str): Record filter passed to the UpdateCursor. '*' or None for all records
         fail_on_exists (bool): Fail if either x_field or y_field already exists, otherwise will overwrite if exists
         show_progress (bool): Show progress in terminal
 
@@ -3412,24 +4253,45 @@ def vertext_add(fname, vertex_index: (int, str), x_field: str, y_field: str = 'y
         _struct.AddField(fname, y_field, field_type=field_type, field_is_nullable=True)
 
     if show_progress:
-        PP = _iolib.PrintProgress(maximum=get_row_count(fname), init_msg='Adding vertex coords...')
+        PP = _iolib.PrintProgress(maximum=get_row_count(fname) * 2, init_msg='Adding vertex coords...')
+    # Resolve the vertex accessor once, firstPoint/lastPoint avoid materialising the part array
+    if str(vertex_index).lower() == 'last':
+        get_pt = lambda g: g.lastPoint  # noqa
+    elif vertex_index == 0:
+        get_pt = lambda g: g.firstPoint  # noqa
+    else:
+        vertex_index = int(vertex_index)
+        get_pt = lambda g: g.getPart(0)[vertex_index]  # noqa
+
     j = 0
-    with _crud.UpdateCursor(fname, ['OID@', x_field, y_field], where_clause=where_clause, load_shape=True) as UpdCur:
-        for R in UpdCur:
-            if len(R.Shape) > 1:
-                _warn('Multipart feature found for row with OID=%s' % R[0])
-
-            if str(vertex_index).lower() == 'last':
-                R[x_field] = R['SHAPE@'].lastPoint.X
-                R[y_field] = R['SHAPE@'].lastPoint.Y
-            else:
-                R[x_field] = R['SHAPE@'][0][vertex_index].X
-                R[y_field] = R['SHAPE@'][0][vertex_index].Y
+    check_multi = Describe(fname)['shapeType'] != 'Point'  # single points cannot be multipart
+    multi_oids = []
+    # Read the coordinates with a SearchCursor, then write them with an UpdateCursor that does not include SHAPE@.
+    # Having SHAPE@ in the UpdateCursor meant every updateRow wrote the unchanged geometry back as well.
+    # Plain da cursors with positional fields, avoids building a crud.Row for every record
+    where_clause = None if where_clause == '*' else where_clause
+    xy_by_oid = {}
+    with _arcpy.da.SearchCursor(fname, ['OID@', 'SHAPE@'], where_clause=where_clause) as SrchCur:
+        for oid, shp in SrchCur:
+            if check_multi and shp.isMultipart:
+                multi_oids.append(oid)
+
+            pt = get_pt(shp)
+            xy_by_oid[oid] = (pt.X, pt.Y)
+            if show_progress:
+                PP.increment()  # noqa
 
-            UpdCur.updateRow(R)
-            j += 1
+    with _arcpy.da.UpdateCursor(fname, ['OID@', x_field, y_field], where_clause=where_clause) as UpdCur:
+        for row in UpdCur:
+            xy = xy_by_oid.get(row[0])
+            if xy is not None:
+                UpdCur.updateRow((row[0],) + xy)
+                j += 1
             if show_progress:
                 PP.increment()  # noqa
+
+    if multi_oids:
+        _warn('Multipart features found for rows with OIDs=%s' % multi_oids)
     return j
 
 
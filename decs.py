@@ -1,6 +1,8 @@
 """Decorators"""
+import functools as _functools
+
 import arcpy as _arcpy
-import fuckit as _fuckit
+
 
 def environ_persist(func):
     """
@@ -9,16 +11,20 @@ def environ_persist(func):
 
     Notes:
         transferdomains: See https://pro.arcgis.com/en/pro-app/latest/tool-reference/environment-settings/transfer-domain-descriptions.htm
+        Only settings which func changed are written back, and each is restored independently, so one failing restore does not skip the others.
     """
+    names = ('workspace', 'overwriteOutput', 'transferDomains')
+
+    @_functools.wraps(func)
     def persist(*args, **kwargs):
-        o = _arcpy.env.overwriteOutput
-        ws = _arcpy.env.workspace
-        d = _arcpy.env.transferDomains
+        snap = [getattr(_arcpy.env, s) for s in names]
         try:
             return func(*args, **kwargs)
         finally:
-            with _fuckit:
-                _arcpy.env.workspace = ws
-                _arcpy.env.overwriteOutput = o
-                _arcpy.env.transferDomains = d
+            for s, v in zip(names, snap):
+                try:
+                    if getattr(_arcpy.env, s) != v:
+                        setattr(_arcpy.env, s, v)
+                except Exception:  # noqa best effort, never mask the result or exception from func
+                    pass
     return persist
@@ -21,6 +21,7 @@ import arcproapi.errors as _errors
 import funclite.baselib as _baselib
 import funclite.stringslib as _stringslib
 import funclite.iolib as _iolib
+import funclite.pandaslib as _pandaslib
 from funclite.baselib import classproperty as _classproperty
 
 
@@ -648,7 +649,9 @@ class MixinPandasHelper:
         self.df = None
         self.df_lower = None
 
-    def aggregate(self, groupflds: (str, list[str]), valueflds: (str, list[str]), *funcs, **kwargs) -> (_pd.DataFrame, None):
+    _NUMBA_FUNCS = {_np.sum: 'sum', _np.mean: 'mean', _np.max: 'max', _np.min: 'min', _np.std: 'std'}
+
+    def aggregate(self, groupflds: (str, list[str]), valueflds: (str, list[str]), *funcs, numba: bool = False, **kwargs) -> (_pd.DataFrame, None):
         """
         Return an aggregated dataframe.
         This is a call to funclite.pandaslib.GroupBy. See documentation for more help.
@@ -659,12 +662,21 @@ class MixinPandasHelper:
             groupflds: List of fields to groupby, or single string
             valueflds: list of fields to apply the aggregate funcs on. Accepts a string as well
             funcs: functions, pass as arguments
+
+            numba:
+                Use pandas' numba engine, which jit compiles the grouped reductions and runs them in parallel. Requires numba.
+                Only used if all funcs are one of np.sum, np.mean, np.max, np.min or np.std and no kwargs are passed,
+                otherwise falls back to pandaslib.GroupBy. Output columns are the groupflds, then <valuefld>_<func> for each valuefld and func.
+
             kwargs: keyword arguments, passed to pandaslib.GroupBy
 
         Returns:
             None: If self.df_lower evaluates to False
             pandas.DataFrame: The aggregation of cls.df_lower.
 
+        Raises:
+            KeyError: If any of groupflds or valueflds are not columns of the dataframe (case insensitive)
+
         Examples:
             >>> import numpy as np
             >>> ResultsAsPandas(..args..).aggregate('country', ['population', 'age'], np.max, np.mean, pandaslib.GroupBy.fMSE)  # noqa
@@ -672,13 +684,27 @@ class MixinPandasHelper:
             Wales   3500000        1234567          101     56
             England ...
         """
-        if not self.df_lower: return None  # noqa
+        if self.df_lower is None or self.df_lower.empty: return None  # noqa
         if isinstance(groupflds, str): groupflds = [groupflds]
         if isinstance(valueflds, str): valueflds = [valueflds]
-        groupflds = list(map(str.lower, groupflds))
-        valueflds = list(map(str.lower, valueflds))
-
-        return pandaslib.GroupBy(self.df_lower, groupflds=groupflds, valueflds=valueflds, *funcs, **kwargs).result  # noqa
+        groupflds = [s.lower() for s in groupflds]
+        valueflds = [s.lower() for s in valueflds]
+        missing = set(groupflds).union(valueflds).difference(self.df_lower.columns)
+        if missing:
+            raise KeyError('Fields %s not found in the dataframe' % sorted(missing))
+
+        if numba and funcs and not kwargs and all(f in MixinPandasHelper._NUMBA_FUNCS for f in funcs):
+            G = self.df_lower.groupby(groupflds, sort=False, observed=True)[valueflds]  # noqa
+            engine_kwargs = {'nopython': True, 'nogil': True, 'parallel': True}
+            parts = []
+            for f in funcs:
+                nm = MixinPandasHelper._NUMBA_FUNCS[f]
+                parts.append(getattr(G, nm)(engine='numba', engine_kwargs=engine_kwargs).add_suffix('_%s' % nm))
+            df = _pd.concat(parts, axis=1)
+            df = df[['%s_%s' % (v, MixinPandasHelper._NUMBA_FUNCS[f]) for v in valueflds for f in funcs]]
+            return df.reset_index()
+
+        return _pandaslib.GroupBy(self.df_lower, groupflds=groupflds, valueflds=valueflds, *funcs, **kwargs).result  # noqa
 
     def export(self, fname_xlsx: str, silent: bool = False, **kwargs) -> str:
         """
@@ -782,9 +808,9 @@ class MixinPandasHelper:
         """
         if not conv_func:
             conv_func = lambda v: v
-        lst = self.df_lower.query(expr=where, **kwargs)['shape_area'].to_list()  # noqa
-        if lst:
-            return conv_func(sum(lst))
+        ser = self.df_lower.query(expr=where, **kwargs)['shape_area'] if where else self.df_lower['shape_area']  # noqa
+        if len(ser):
+            return conv_func(float(ser.sum()))
         return 0
 
     @property
@@ -827,9 +853,9 @@ class MixinPandasHelper:
         if not conv_func:
             conv_func = lambda v: v
 
-        lst = self.df_lower.query(expr=where, **kwargs)['shape_length'].to_list()  # noqa
-        if lst:
-            return conv_func(sum(lst))
+        ser = self.df_lower.query(expr=where, **kwargs)['shape_length'] if where else self.df_lower['shape_length']  # noqa
+        if len(ser):
+            return conv_func(float(ser.sum()))
         return 0
 
 
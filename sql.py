@@ -118,6 +118,46 @@ def query_where_not_in(field_name: str, values: (tuple, str, list), datasource:
     return sql
 
 
+def query_where_in_ranges(field_name: str, values: (tuple, list), min_run: int = 4, max_in_batch: int = 200) -> list[str]:
+    """
+    Build a list of where clauses which together match integer values, e.g. a list of OIDs.
+
+    Consecutive runs of values are written as range predicates, with the remaining
+    values in IN clauses of at most max_in_batch values. This keeps clauses short,
+    where a single IN list of thousands of values is slow to parse and can exceed query length limits.
+
+    Args:
+        field_name (str): name of column to query
+        values (tuple, list): iterable of ints. Duplicates are ignored
+        min_run (int): runs of consecutive values at least this long are written as a range
+        max_in_batch (int): max number of values in each IN clause
+
+    Returns:
+        list[str]: List of where clauses. A row matches if it matches any one of the clauses. Empty list if values is empty.
+
+    Examples:
+        >>> query_where_in_ranges('OBJECTID', [1, 2, 3, 4, 5, 9, 11])
+        ['(OBJECTID >= 1 AND OBJECTID <= 5)', 'OBJECTID IN (9,11)']
+    """
+    vals = sorted(set(values))
+    out = []
+    singles = []
+    i = 0
+    while i < len(vals):
+        j = i
+        while j + 1 < len(vals) and vals[j + 1] == vals[j] + 1:
+            j += 1
+        if j - i + 1 >= min_run:
+            out.append('(%s >= %s AND %s <= %s)' % (field_name, vals[i], field_name, vals[j]))
+        else:
+            singles.extend(vals[i:j + 1])
+        i = j + 1
+
+    for k in range(0, len(singles), max_in_batch):
+        out.append('%s IN (%s)' % (field_name, ','.join(str(v) for v in singles[k:k + max_in_batch])))
+    return out
+
+
 def strip_where(sql):
     """(str)->str
     Get everything after the where clause in a string
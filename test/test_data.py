@@ -46,6 +46,68 @@ class Test(unittest.TestCase):
         """misc stuff"""
         data.field_get_dup_values(r'S:\SPECIAL-ACL\ERAMMP2 Survey Restricted\Handover space\2 PERSONAL Permissions for ERAMMP 2021\Local geodatabase\permissionsERAMMP.gdb\AllSurveyedSquares', 'SQ_ID')
 
+    def test_del_dups(self):
+        """test_del_dups"""
+        rank = lambda itm: itm[1][0]  # noqa
+        dup_dict = {1: [5], 2: [3], 3: [9], 4: [3], 5: [9]}
+
+        # lowest rank retained, the first in dup_dict wins a tie
+        self.assertEqual(sorted(data.Spatial._del_dups(dup_dict, rank, False)), [1, 3, 4, 5])  # noqa
+        # highest rank retained, the first in dup_dict wins a tie
+        self.assertEqual(sorted(data.Spatial._del_dups(dup_dict, rank, True)), [1, 2, 4, 5])  # noqa
+
+        # Matches the stable sort this replaced, which retained the first item of the sorted dict
+        for reverse in (False, True):
+            keep = sorted(dup_dict.items(), key=rank, reverse=reverse)[0][0]
+            self.assertEqual(sorted(data.Spatial._del_dups(dup_dict, rank, reverse)), sorted(k for k in dup_dict if k != keep))  # noqa
+
+        # all tied
+        self.assertEqual(data.Spatial._del_dups({7: [1], 8: [1], 9: [1]}, rank, False), [8, 9])  # noqa
+        self.assertEqual(data.Spatial._del_dups({7: [1], 8: [1], 9: [1]}, rank, True), [8, 9])  # noqa
+
+    def test_del_rows(self):
+        """test_del_rows"""
+        rows = [(1, 'a'), (1, 'b'), (2, 'b'), (2, None), (3, 'c'), (None, None), (None, 'a')]
+
+        def _tbl():
+            tmp = r'memory\del_rows_test'
+            if arcpy.Exists(tmp):
+                arcpy.Delete_management(tmp)
+            arcpy.management.CreateTable('memory', 'del_rows_test')
+            arcpy.management.AddField(tmp, 'cola', 'LONG')
+            arcpy.management.AddField(tmp, 'colb', 'TEXT')
+            with arcpy.da.InsertCursor(tmp, ['cola', 'colb']) as IC:
+                for r in rows:
+                    IC.insertRow(r)
+            return tmp
+
+        def _remaining(tmp):
+            with arcpy.da.SearchCursor(tmp, ['cola', 'colb']) as Cur:
+                return sorted([tuple(r) for r in Cur], key=str)
+
+        def _pairwise(criteria):
+            # reference, the original pairwise matching of criteria tuples against rows
+            return sorted([r for r in rows if not any(all(a == b for a, b in zip(crit, r)) for crit in criteria)], key=str)
+
+        # full length criteria, matched with the set lookup
+        tmp = _tbl()
+        n = data.del_rows(tmp, ['cola', 'colb'], [[1, 2, 3], ['a', 'b', 'c']], show_progress=False)
+        self.assertEqual(n, 3)
+        self.assertEqual(_remaining(tmp), _pairwise([(1, 'a'), (2, 'b'), (3, 'c')]))
+
+        # single col
+        tmp = _tbl()
+        n = data.del_rows(tmp, 'cola', 2, show_progress=False)
+        self.assertEqual(n, 2)
+        self.assertEqual(_remaining(tmp), _pairwise([(2,)]))
+
+        # vals=None with several cols gives criteria [[None]], shorter than cols, so only cola is compared
+        tmp = _tbl()
+        n = data.del_rows(tmp, ['cola', 'colb'], None, show_progress=False)
+        self.assertEqual(n, 2)
+        self.assertEqual(_remaining(tmp), _pairwise([(None,)]))
+        arcpy.Delete_management(tmp)
+
 
 
 if __name__ == '__main__':
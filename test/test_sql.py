@@ -0,0 +1,39 @@
+"""unit tests for sql"""
+import unittest
+
+import arcproapi.sql as sql
+
+
+class Test(unittest.TestCase):
+    """unittest for sql"""
+
+    def test_query_where_in_ranges(self):
+        """test_query_where_in_ranges"""
+        # run of 5 becomes a range, the rest go in an IN
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [1, 2, 3, 4, 5, 9, 11]), ['(OBJECTID >= 1 AND OBJECTID <= 5)', 'OBJECTID IN (9,11)'])
+
+        # unsorted with duplicates
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [11, 3, 1, 2, 9, 4, 5, 5]), ['(OBJECTID >= 1 AND OBJECTID <= 5)', 'OBJECTID IN (9,11)'])
+
+        # two runs
+        self.assertEqual(sql.query_where_in_ranges('OID', [1, 2, 3, 4, 10, 11, 12, 13, 14]), ['(OID >= 1 AND OID <= 4)', '(OID >= 10 AND OID <= 14)'])
+
+        # empty input
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', []), [])
+
+    def test_query_where_in_ranges_min_run(self):
+        """test_query_where_in_ranges_min_run"""
+        # run shorter than min_run stays in the IN
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [1, 2, 3, 7]), ['OBJECTID IN (1,2,3,7)'])
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [1, 2, 3, 7], min_run=3), ['(OBJECTID >= 1 AND OBJECTID <= 3)', 'OBJECTID IN (7)'])
+
+    def test_query_where_in_ranges_max_in_batch(self):
+        """test_query_where_in_ranges_max_in_batch"""
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [1, 3, 5, 7, 9], max_in_batch=2), ['OBJECTID IN (1,3)', 'OBJECTID IN (5,7)', 'OBJECTID IN (9)'])
+
+        # ranges come first, then the batched singles
+        self.assertEqual(sql.query_where_in_ranges('OBJECTID', [20, 1, 2, 3, 4, 30, 40], max_in_batch=2), ['(OBJECTID >= 1 AND OBJECTID <= 4)', 'OBJECTID IN (20,30)', 'OBJECTID IN (40)'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)